@@ -0,0 +1,61 @@
+"""Helpers shared by the Roadmap snapshot scripts.
+
+The scripts are run directly (``python3 scripts/<name>.py``), which puts this
+directory on ``sys.path`` so they can ``from _common import ...``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+def env_str(key: str, default: str | None = None) -> str | None:
+    """Return the stripped env var, or ``default`` when unset or blank."""
+    val = os.environ.get(key)
+    if val is None or not str(val).strip():
+        return default
+    return str(val).strip()
+
+
+def env_int(key: str, default: int) -> int:
+    """Return the env var parsed as int, or ``default`` when unset or invalid."""
+    val = env_str(key)
+    if val is None:
+        return default
+    try:
+        return int(val)
+    except ValueError:
+        return default
+
+
+def atomic_write_json(path: Path, payload: dict) -> bool:
+    """Write ``payload`` as indented UTF-8 JSON via a temp file + rename.
+
+    Returns ``False`` without touching the file when it already holds exactly
+    these bytes, so unchanged outputs keep their mtime.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        data = orjson.dumps(
+            payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+    else:
+        data = (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode(
+            "utf-8"
+        )
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+    return True
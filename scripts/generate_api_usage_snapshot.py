@@ -21,6 +21,8 @@ import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from _common import atomic_write_json
+
 # ── helpers ──────────────────────────────────────────────────────────────────
 
 
@@ -29,15 +31,6 @@ def _default_output_path() -> Path:
     return root / "config" / "api_usage.json"
 
 
-def _atomic_write_json(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
-    )
-    tmp.replace(path)
-
-
 def _load_env(path: str) -> None:
     """Minimal .env loader — no external dependency."""
     if not os.path.isfile(path):
@@ -312,7 +305,7 @@ def main() -> int:
     if sla:
         payload["sla"] = sla
 
-    _atomic_write_json(Path(args.output), payload)
+    atomic_write_json(Path(args.output), payload)
     print(f"[api_usage_snapshot] Wrote {args.output}", file=sys.stderr)
 
     # Print summary
@@ -16,20 +16,64 @@ Environment variables (optional):
     CREATOR_ADDRESSES - Comma-separated Solana wallet addresses
     CREATOR_ADDRESS   - Single address (legacy, used if CREATOR_ADDRESSES not set)
     OUTPUT_PATH       - Output JSON file path (default: config/creator_fees.json)
+    CACHE_DIR         - Directory for cached API responses (default: <tmp>/roadmap-creator-fees)
+
+The response cache only helps repeated local runs. The GitHub Actions runner
+starts every run with an empty temp dir, and its 2-hourly schedule is longer
+than every TTL below, so CI always fetches fresh data.
 """
 
 from __future__ import annotations
 
 import json
-import os
+import math
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.parse import urlsplit
 
+import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from _common import atomic_write_json, env_int, env_str
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+USER_AGENT = "Mozilla/5.0 Roadmap/1.0"
+COINGECKO_SOL_PRICE_URL = (
+    "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd"
+)
+
+# CoinGecko edge-caches /simple/price for ~30s, so anything fresher than this
+# is as good as a new request.
+SOL_PRICE_TTL_SECONDS = 60
+FALLBACK_SOL_PRICE_USD = 200.0
+
+# pump.fun bucket caches: the newest bucket keeps mutating, so fine-grained
+# intervals expire quickly; daily buckets only gain today's running total.
+BUCKETS_TTL_SECONDS = {"5m": 300, "30m": 300, "1d": 3600}
+
+# After this many consecutive transient failures against a host (each already
+# retried by the session), further requests to it fail fast instead of piling up.
+CIRCUIT_BREAKER_THRESHOLD = env_int("CIRCUIT_BREAKER_THRESHOLD", 5)
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts the trailing "Z" natively since 3.11.
+    _parse_bucket_time = datetime.fromisoformat
+else:  # pragma: no cover
+
+    def _parse_bucket_time(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
 
 
 def _default_output_path() -> Path:
@@ -37,67 +81,210 @@ def _default_output_path() -> Path:
     return root / "config" / "creator_fees.json"
 
 
-def _atomic_write_json(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+def _cache_dir() -> Path:
+    """Cache location; the default temp dir does not survive between CI runs."""
+    return Path(
+        env_str("CACHE_DIR")
+        or Path(tempfile.gettempdir()) / "roadmap-creator-fees"
     )
-    tmp.replace(path)
 
 
-def _env_str(key: str, default: Optional[str] = None) -> Optional[str]:
-    val = os.environ.get(key)
-    if val is None or not str(val).strip():
-        return default
-    return str(val).strip()
+def _price_cache_path() -> Path:
+    return _cache_dir() / "sol_price.json"
+
+
+def _read_price_cache() -> Optional[Dict[str, float]]:
+    """Return the cached ``{ts, price}`` entry, or None if missing/corrupt."""
+    try:
+        data = json.loads(_price_cache_path().read_text(encoding="utf-8"))
+        return {"ts": float(data["ts"]), "price": float(data["price"])}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+_SESSION: Optional[requests.Session] = None
+_host_failures: Dict[str, int] = {}
+_host_failures_lock = threading.Lock()
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised instead of issuing a request to a host that keeps failing."""
+
+
+def _is_transient(exc: requests.RequestException) -> bool:
+    """True for failures that say the host is unhealthy rather than the request wrong."""
+    if isinstance(exc, requests.HTTPError):
+        status = exc.response.status_code if exc.response is not None else 0
+        return status == 429 or status >= 500
+    # RetryError means the session gave up on a 429/5xx from status_forcelist.
+    return isinstance(
+        exc, (requests.ConnectionError, requests.Timeout, requests.exceptions.RetryError)
+    )
+
+
+def _build_session() -> requests.Session:
+    """Build a pooled session shared by all pump.fun / CoinGecko requests."""
+    retry = Retry(
+        total=5,
+        backoff_factor=0.3,
+        backoff_jitter=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"})
+    session.mount("https://", adapter)
+    return session
+
+
+def _get_session() -> requests.Session:
+    """Return the module-wide session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = _build_session()
+    return _SESSION
+
+
+def _close_session() -> None:
+    global _SESSION
+    if _SESSION is not None:
+        _SESSION.close()
+        _SESSION = None
 
 
 def fetch_json(url: str, timeout: int = 30) -> Union[Dict[str, Any], List[Any]]:
-    """Fetch JSON from a URL."""
-    req = Request(url, headers={"User-Agent": "Mozilla/5.0 Roadmap/1.0"})
-    with urlopen(req, timeout=timeout) as resp:
-        response_text = resp.read().decode("utf-8")
-        logger.debug(f"Fetched data from {url}: {response_text}...")
-        return json.loads(response_text)
+    """Fetch JSON from a URL (gzip-encoded; requests decompresses transparently)."""
+    host = urlsplit(url).netloc
+    with _host_failures_lock:
+        if _host_failures.get(host, 0) >= CIRCUIT_BREAKER_THRESHOLD:
+            raise CircuitOpenError(f"Circuit open for {host}; skipping {url}")
+    try:
+        resp = _get_session().get(url, timeout=timeout)
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        # A deterministic 4xx (e.g. 404 for an unknown creator) still means the
+        # host answered, so only transient failures move the breaker.
+        with _host_failures_lock:
+            if _is_transient(e):
+                _host_failures[host] = _host_failures.get(host, 0) + 1
+            else:
+                _host_failures[host] = 0
+        raise
+    with _host_failures_lock:
+        _host_failures[host] = 0
+    # Lazy so the body is only decoded to text when debug logging is enabled.
+    logger.opt(lazy=True).debug(
+        "Fetched data from {}: {}...", lambda: url, lambda: resp.text
+    )
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def _parse_sol_price(data: Any) -> float:
+    """Validate a CoinGecko ``{"solana": {"usd": <price>}}`` payload."""
+    solana = data.get("solana") if isinstance(data, dict) else None
+    price = solana.get("usd") if isinstance(solana, dict) else None
+    if isinstance(price, bool) or not isinstance(price, (int, float)) or price <= 0:
+        raise ValueError(f"unexpected CoinGecko price payload: {data!r}")
+    return float(price)
 
 
 def fetch_sol_price_usd() -> float:
-    """Fetch current SOL price in USD from CoinGecko."""
-    url = "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd"
+    """
+    Fetch current SOL price in USD from CoinGecko.
+
+    Serves the on-disk cached price while it is younger than
+    SOL_PRICE_TTL_SECONDS, and falls back to a stale cached price (then to
+    FALLBACK_SOL_PRICE_USD) when CoinGecko is unavailable.
+    """
+    cached = _read_price_cache()
+    if cached and time.time() - cached["ts"] < SOL_PRICE_TTL_SECONDS:
+        return cached["price"]
+
     try:
-        data = fetch_json(url)
-        return float(data["solana"]["usd"])
+        price = _parse_sol_price(fetch_json(COINGECKO_SOL_PRICE_URL))
     except Exception as e:
         logger.warning(
             f"Warning: Failed to fetch SOL price from CoinGecko: {e}", file=sys.stderr
         )
-        # Fallback price if API fails
-        return 200.0
+        if cached:
+            return cached["price"]
+        # Fallback price if API fails and nothing is cached
+        return FALLBACK_SOL_PRICE_USD
+
+    try:
+        atomic_write_json(_price_cache_path(), {"ts": time.time(), "price": price})
+    except OSError as e:
+        logger.warning(f"Warning: Failed to cache SOL price: {e}")
+    return price
+
+
+def _fetch_buckets_cached(
+    creator_address: str, interval: str, limit: int
+) -> List[Dict[str, Any]]:
+    """
+    Fetch fee buckets, serving a per-address cache younger than the interval TTL.
+
+    A stale cache entry is returned (with a warning) if the API request fails.
+    """
+    cache_path = _cache_dir() / f"pumpfun_{interval}_{creator_address}.json"
+    cached: Optional[List[Dict[str, Any]]] = None
+    try:
+        age = time.time() - cache_path.stat().st_mtime
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))["buckets"]
+        if age < BUCKETS_TTL_SECONDS[interval]:
+            return cached
+    except (OSError, ValueError, KeyError, TypeError):
+        cached = None
+
+    url = f"https://swap-api.pump.fun/v1/creators/{creator_address}/fees?interval={interval}&limit={limit}"
+    try:
+        buckets = fetch_json(url)
+    except requests.RequestException as e:
+        if cached is None:
+            raise
+        logger.warning(
+            f"Warning: Using stale {interval} buckets for {creator_address}: {e}"
+        )
+        return cached
+
+    try:
+        atomic_write_json(cache_path, {"buckets": buckets})
+    except OSError as e:
+        logger.warning(f"Warning: Failed to cache {interval} buckets: {e}")
+    return buckets
 
 
 def fetch_creator_fees_5m(creator_address: str) -> List[Dict[str, Any]]:
     """Fetch 5m-interval buckets (~25h) for precise 24h calculation."""
-    url = f"https://swap-api.pump.fun/v1/creators/{creator_address}/fees?interval=5m&limit=300"
-    return fetch_json(url)
+    return _fetch_buckets_cached(creator_address, "5m", 300)
 
 
 def fetch_creator_fees_30m(creator_address: str) -> List[Dict[str, Any]]:
     """Fetch 30m-interval buckets (~8 days) for precise 7d calculation."""
-    url = f"https://swap-api.pump.fun/v1/creators/{creator_address}/fees?interval=30m&limit=400"
-    return fetch_json(url)
+    return _fetch_buckets_cached(creator_address, "30m", 400)
 
 
 def fetch_creator_fees_1d(creator_address: str) -> List[Dict[str, Any]]:
-    """Fetch 1d-interval buckets (~1 year) for 30d and all-time totals."""
-    url = f"https://swap-api.pump.fun/v1/creators/{creator_address}/fees?interval=1d&limit=365"
-    return fetch_json(url)
+    """
+    Fetch the latest 31 daily buckets for 30d and all-time totals.
+
+    The 30d window starts at midnight 30 days ago, so it spans exactly 31
+    daily buckets; the all-time total comes from the newest bucket's
+    cumulativeCreatorFeeSOL, which does not depend on how many are fetched.
+    """
+    return _fetch_buckets_cached(creator_address, "1d", 31)
 
 
 def calculate_fees_for_periods(
     buckets_5m: List[Dict[str, Any]],
     buckets_30m: List[Dict[str, Any]],
     daily_buckets: List[Dict[str, Any]],
+    *,
+    now: Optional[datetime] = None,
 ) -> Dict[str, Any]:
     """
     Calculate total creator fees for last 24h, 7d, 30d periods.
@@ -106,70 +293,60 @@ def calculate_fees_for_periods(
     - buckets_5m (5m interval): precise 24h calculation
     - buckets_30m (30m interval): precise 7d calculation
     - daily_buckets (1d interval): 30d and all-time totals
+
+    Pass ``now`` to evaluate several addresses against the same cutoffs.
     """
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
 
-    def parse_buckets(buckets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Parse bucket data into structured format."""
-        parsed = []
+    def sum_fees_since(
+        buckets: List[Dict[str, Any]], since: datetime
+    ) -> tuple[float, int, float]:
+        """
+        Sum fees and trades since a given time in a single pass.
+
+        Also returns the cumulative fee of the newest bucket, so callers never
+        need a parsed or sorted copy of the raw bucket list.
+        """
+        # Whole unix seconds: bucket times are second-aligned, so rounding the
+        # cutoff up keeps ``ts >= since_ts`` equivalent to ``time >= since``.
+        since_ts = math.ceil(since.timestamp())
+        total_fee = 0.0
+        total_trades = 0
+        latest_ts: Optional[int] = None
+        latest_cumulative = 0.0
         for bucket in buckets:
             bucket_time_str = bucket.get("bucket", "")
             if not bucket_time_str:
                 continue
             try:
-                bucket_time = datetime.fromisoformat(
-                    bucket_time_str.replace("Z", "+00:00")
-                )
+                ts = int(_parse_bucket_time(bucket_time_str).timestamp())
             except ValueError:
                 continue
-            fee_sol = float(bucket.get("creatorFeeSOL", "0") or "0")
-            cumulative_sol = float(bucket.get("cumulativeCreatorFeeSOL", "0") or "0")
-            num_trades = int(bucket.get("numTrades", 0) or 0)
-            parsed.append(
-                {
-                    "time": bucket_time,
-                    "fee_sol": fee_sol,
-                    "cumulative_sol": cumulative_sol,
-                    "num_trades": num_trades,
-                }
-            )
-        return sorted(parsed, key=lambda x: x["time"])
-
-    def sum_fees_since(
-        parsed: List[Dict[str, Any]], since: datetime
-    ) -> tuple[float, int]:
-        """Sum fees and trades since a given time."""
-        total_fee = 0.0
-        total_trades = 0
-        for b in parsed:
-            if b["time"] >= since:
-                total_fee += b["fee_sol"]
-                total_trades += b["num_trades"]
-        return total_fee, total_trades
-
-    # Parse all data sources
-    parsed_5m = parse_buckets(buckets_5m)
-    parsed_30m = parse_buckets(buckets_30m)
-    daily_parsed = parse_buckets(daily_buckets)
-
-    # Get total from the most recent cumulative value
-    total_sol = 0.0
-    if daily_parsed:
-        total_sol = daily_parsed[-1]["cumulative_sol"]
+            if ts >= since_ts:
+                total_fee += float(bucket.get("creatorFeeSOL", "0") or "0")
+                total_trades += int(bucket.get("numTrades", 0) or 0)
+            if latest_ts is None or ts >= latest_ts:
+                latest_ts = ts
+                latest_cumulative = float(
+                    bucket.get("cumulativeCreatorFeeSOL", "0") or "0"
+                )
+        return total_fee, total_trades, latest_cumulative
 
     # 24h from 5m data (precise)
     hours_24_ago = now - timedelta(hours=24)
-    fees_24h, trades_24h = sum_fees_since(parsed_5m, hours_24_ago)
+    fees_24h, trades_24h, _ = sum_fees_since(buckets_5m, hours_24_ago)
 
     # 7d from 30m data (precise)
     days_7_ago = now - timedelta(days=7)
-    fees_7d, trades_7d = sum_fees_since(parsed_30m, days_7_ago)
+    fees_7d, trades_7d, _ = sum_fees_since(buckets_30m, days_7_ago)
 
-    # 30d from daily data (truncate to start of day for correct inclusion)
+    # 30d from daily data (truncate to start of day for correct inclusion);
+    # total comes from the most recent daily cumulative value.
     days_30_ago = (now - timedelta(days=30)).replace(
         hour=0, minute=0, second=0, microsecond=0
     )
-    fees_30d, trades_30d = sum_fees_since(daily_parsed, days_30_ago)
+    fees_30d, trades_30d, total_sol = sum_fees_since(daily_buckets, days_30_ago)
 
     return {
         "last_1d_sol": round(max(0, fees_24h), 4),
@@ -184,10 +361,10 @@ def calculate_fees_for_periods(
 
 def _get_creator_addresses() -> List[str]:
     """Get list of creator addresses from env or defaults."""
-    multi = _env_str("CREATOR_ADDRESSES")
+    multi = env_str("CREATOR_ADDRESSES")
     if multi:
         return [a.strip() for a in multi.split(",") if a.strip()]
-    single = _env_str("CREATOR_ADDRESS")
+    single = env_str("CREATOR_ADDRESS")
     if single:
         return [single]
     return [
@@ -218,29 +395,52 @@ def _merge_fees(all_fees: List[Dict[str, Any]]) -> Dict[str, Any]:
 
 def main() -> int:
     addresses = _get_creator_addresses()
-    output_path = Path(_env_str("OUTPUT_PATH") or _default_output_path())
+    output_path = Path(env_str("OUTPUT_PATH") or _default_output_path())
 
     print(f"Fetching creator fees for {len(addresses)} address(es)...")
+    # Single reference time for every address's windows and the snapshot as_of.
+    now = datetime.now(timezone.utc)
 
     try:
-        all_fees = []
-        for addr in addresses:
-            print(f"\n  [{addr[:8]}...{addr[-4:]}]")
+        # Create the shared session before fanning out to worker threads.
+        _get_session()
+        with ThreadPoolExecutor(
+            max_workers=min(16, len(addresses) * 3 + 1)
+        ) as pool:
+            # Dispatch every request up front so they overlap on the shared pool.
+            price_future = pool.submit(fetch_sol_price_usd)
+            bucket_futures = [
+                (
+                    addr,
+                    pool.submit(fetch_creator_fees_5m, addr),
+                    pool.submit(fetch_creator_fees_30m, addr),
+                    pool.submit(fetch_creator_fees_1d, addr),
+                )
+                for addr in addresses
+            ]
+
+            all_fees = []
+            for addr, fut_5m, fut_30m, fut_1d in bucket_futures:
+                print(f"\n  [{addr[:8]}...{addr[-4:]}]")
+
+                buckets_5m = fut_5m.result()
+                print(f"    Retrieved {len(buckets_5m)} 5m buckets")
 
-            buckets_5m = fetch_creator_fees_5m(addr)
-            print(f"    Retrieved {len(buckets_5m)} 5m buckets")
+                buckets_30m = fut_30m.result()
+                print(f"    Retrieved {len(buckets_30m)} 30m buckets")
 
-            buckets_30m = fetch_creator_fees_30m(addr)
-            print(f"    Retrieved {len(buckets_30m)} 30m buckets")
+                daily_buckets = fut_1d.result()
+                print(f"    Retrieved {len(daily_buckets)} daily buckets")
 
-            daily_buckets = fetch_creator_fees_1d(addr)
-            print(f"    Retrieved {len(daily_buckets)} daily buckets")
+                fees = calculate_fees_for_periods(
+                    buckets_5m, buckets_30m, daily_buckets, now=now
+                )
+                print(
+                    f"    1d: {fees['last_1d_sol']:.4f} SOL  7d: {fees['last_7d_sol']:.4f} SOL  30d: {fees['last_30d_sol']:.4f} SOL  total: {fees['total_sol']:.4f} SOL"
+                )
+                all_fees.append(fees)
 
-            fees = calculate_fees_for_periods(buckets_5m, buckets_30m, daily_buckets)
-            print(
-                f"    1d: {fees['last_1d_sol']:.4f} SOL  7d: {fees['last_7d_sol']:.4f} SOL  30d: {fees['last_30d_sol']:.4f} SOL  total: {fees['total_sol']:.4f} SOL"
-            )
-            all_fees.append(fees)
+            sol_price = price_future.result()
 
         merged = _merge_fees(all_fees)
         print("\n  Merged totals:")
@@ -255,13 +455,11 @@ def main() -> int:
         )
         print(f"    Total: {merged['total_sol']:.4f} SOL")
 
-        # Fetch SOL price
-        sol_price = fetch_sol_price_usd()
         print(f"  SOL price: ${sol_price:.2f}")
 
         # Build snapshot
         snapshot = {
-            "as_of": datetime.now(timezone.utc).isoformat(),
+            "as_of": now.isoformat(),
             "creator_addresses": addresses,
             "sol_price_usd": round(sol_price, 2),
             "last_1d_sol": merged["last_1d_sol"],
@@ -278,20 +476,25 @@ def main() -> int:
         }
 
         # Write output
-        _atomic_write_json(output_path, snapshot)
+        atomic_write_json(output_path, snapshot)
         print(f"Wrote snapshot to {output_path}")
 
         return 0
 
-    except HTTPError as e:
-        print(f"HTTP Error: {e.code} {e.reason}", file=sys.stderr)
+    except requests.HTTPError as e:
+        print(
+            f"HTTP Error: {e.response.status_code} {e.response.reason}",
+            file=sys.stderr,
+        )
         return 1
-    except URLError as e:
-        print(f"URL Error: {e.reason}", file=sys.stderr)
+    except requests.RequestException as e:
+        print(f"Request Error: {e}", file=sys.stderr)
         return 1
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
+    finally:
+        _close_session()
 
 
 if __name__ == "__main__":
@@ -8,55 +8,25 @@ Usage:
 
     # With explicit flags
     python3 scripts/generate_recent_orders.py --pgsql-host 127.0.0.1 --limit 20
+
+The query relies on the (state, created_at DESC) index from
+``scripts/sql/create_order_indexes.sql`` to read only ``--limit`` rows.
 """
 
 import argparse
-import json
-import os
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
+from _common import atomic_write_json, env_str, env_int
+
 
 def _default_output_path() -> Path:
     root = Path(__file__).resolve().parent.parent
     return root / "config" / "recent_orders.json"
 
 
-def _atomic_write_json(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
-    )
-    tmp.replace(path)
-
-
-def _env_str(key: str, default: str | None = None) -> str | None:
-    val = os.environ.get(key)
-    if val is None or not str(val).strip():
-        return default
-    return str(val).strip()
-
-
-def _env_int(key: str, default: int) -> int:
-    val = _env_str(key)
-    if val is None:
-        return default
-    try:
-        return int(val)
-    except ValueError:
-        return default
-
-
-def _mask_order_id(order_id: str) -> str:
-    """Keep first 10 and last 10 characters, mask the middle with '****'."""
-    s = str(order_id)
-    if len(s) <= 20:
-        return s
-    return s[:10] + "****" + s[-10:]
-
-
-def _django_query(
+def _pg_query(
     *,
     limit: int,
     orders_table: str,
@@ -66,65 +36,50 @@ def _django_query(
     pgsql_password: str | None,
     pgsql_database: str,
 ) -> dict:
-    """Query recent finished orders via Django ORM (standalone)."""
-    import django
-    from django.conf import settings
-
-    if not settings.configured:
-        settings.configure(
-            SECRET_KEY="recent-orders-snapshot",
-            INSTALLED_APPS=["django.contrib.contenttypes"],
-            DATABASES={
-                "default": {
-                    "ENGINE": "django.db.backends.postgresql",
-                    "NAME": pgsql_database,
-                    "USER": pgsql_user,
-                    "PASSWORD": pgsql_password or "",
-                    "HOST": pgsql_host,
-                    "PORT": pgsql_port,
-                }
-            },
-            TIME_ZONE="UTC",
-            USE_TZ=True,
-            DEFAULT_AUTO_FIELD="django.db.models.AutoField",
-        )
-
-    django.setup()
-
-    from django.db import models
-    from django.utils import timezone as dj_tz
-
-    class Order(models.Model):
-        id = models.UUIDField(primary_key=True)
-        description = models.CharField(max_length=255, null=True)
-        price = models.FloatField(null=True)
-        state = models.CharField(max_length=20, null=True)
-        pay_way = models.CharField(max_length=20, null=True)
-        created_at = models.DateTimeField(null=True)
-
-        class Meta:
-            managed = False
-            db_table = orders_table
-            app_label = "recent_orders_snapshot"
-
-    now = dj_tz.now()
-
-    rows = (
-        Order.objects.filter(state="Finished")
-        .exclude(price__isnull=True)
-        .exclude(price__lte=0)
-        .order_by("-created_at")[:limit]
+    """Query recent finished orders with one raw SQL statement via psycopg2."""
+    import psycopg2
+    import psycopg2.extras
+    from psycopg2 import sql
+
+    # Order ids are masked in SQL: keep the first and last 10 characters and
+    # replace the middle with '****' (ids of 20 characters or less are kept).
+    query = sql.SQL(
+        "SELECT"
+        " CASE WHEN length(id::text) > 20"
+        " THEN left(id::text, 10) || '****' || right(id::text, 10)"
+        " ELSE id::text END AS id,"
+        " created_at, pay_way, price, description FROM {table}"
+        " WHERE state = 'Finished' AND price IS NOT NULL AND price > 0"
+        " ORDER BY created_at DESC LIMIT %s"
+    ).format(table=sql.Identifier(*orders_table.split(".")))
+
+    now = datetime.now(timezone.utc)
+    conn = psycopg2.connect(
+        host=pgsql_host,
+        port=pgsql_port,
+        user=pgsql_user,
+        password=pgsql_password or "",
+        dbname=pgsql_database,
+        options="-c TimeZone=UTC",
     )
+    try:
+        with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+            cur.execute(query, (limit,))
+            rows = cur.fetchall()
+    finally:
+        conn.close()
 
     orders = []
     for row in rows:
+        created_at = row["created_at"]
+        price = row["price"]
         orders.append(
             {
-                "id": _mask_order_id(str(row.id)),
-                "created_at": row.created_at.isoformat() if row.created_at else None,
-                "pay_way": row.pay_way or "Unknown",
-                "price": round(row.price, 2) if row.price else 0,
-                "description": row.description or "",
+                "id": row["id"],
+                "created_at": created_at.isoformat() if created_at else None,
+                "pay_way": row["pay_way"] or "Unknown",
+                "price": round(float(price), 2) if price else 0,
+                "description": row["description"] or "",
             }
         )
 
@@ -158,34 +113,34 @@ def main() -> int:
     )
     parser.add_argument(
         "--pgsql-host",
-        default=_env_str("PGSQL_HOST", "localhost"),
+        default=env_str("PGSQL_HOST", "localhost"),
         help="Postgres host (default: $PGSQL_HOST or localhost)",
     )
     parser.add_argument(
         "--pgsql-port",
         type=int,
-        default=_env_int("PGSQL_PORT", 5432),
+        default=env_int("PGSQL_PORT", 5432),
         help="Postgres port (default: $PGSQL_PORT or 5432)",
     )
     parser.add_argument(
         "--pgsql-user",
-        default=_env_str("PGSQL_USER", "postgres"),
+        default=env_str("PGSQL_USER", "postgres"),
         help="Postgres user (default: $PGSQL_USER or postgres)",
     )
     parser.add_argument(
         "--pgsql-password",
-        default=_env_str("PGSQL_PASSWORD"),
+        default=env_str("PGSQL_PASSWORD"),
         help="Postgres password (default: $PGSQL_PASSWORD)",
     )
     parser.add_argument(
         "--pgsql-database",
-        default=_env_str("PGSQL_DATABASE", "acedatacloud_platform"),
+        default=env_str("PGSQL_DATABASE", "acedatacloud_platform"),
         help="Postgres database (default: $PGSQL_DATABASE or acedatacloud_platform)",
     )
     args = parser.parse_args()
 
     try:
-        result = _django_query(
+        result = _pg_query(
             limit=int(args.limit),
             orders_table=str(args.orders_table).strip() or "app_order",
             pgsql_host=str(args.pgsql_host),
@@ -196,15 +151,15 @@ def main() -> int:
         )
     except Exception as exc:
         print(
-            "[recent_orders] Failed to query Postgres via Django ORM.\n"
-            "  - Install deps: `pip install Django psycopg2-binary`\n"
+            "[recent_orders] Failed to query Postgres.\n"
+            "  - Install deps: `pip install psycopg2-binary`\n"
             "  - Export PGSQL_HOST/PGSQL_PORT/PGSQL_USER/PGSQL_PASSWORD/PGSQL_DATABASE\n"
             f"  - Error: {exc}",
             file=sys.stderr,
         )
         return 2
 
-    _atomic_write_json(Path(args.output), result)
+    atomic_write_json(Path(args.output), result)
     print(f"[recent_orders] Wrote {args.output} ({result['total']} orders)")
     return 0
 
@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 import argparse
-import json
-import os
 import sys
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from _common import atomic_write_json, env_str, env_int
+
 
 def _default_output_path() -> Path:
     # Roadmap layout: <root>/Roadmap/scripts/generate_revenue_snapshot.py -> <root>/Roadmap/config/revenue.json
@@ -13,33 +13,7 @@ def _default_output_path() -> Path:
     return root / "config" / "revenue.json"
 
 
-def _atomic_write_json(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
-    )
-    tmp.replace(path)
-
-
-def _env_str(key: str, default: str | None = None) -> str | None:
-    val = os.environ.get(key)
-    if val is None or not str(val).strip():
-        return default
-    return str(val).strip()
-
-
-def _env_int(key: str, default: int) -> int:
-    val = _env_str(key)
-    if val is None:
-        return default
-    try:
-        return int(val)
-    except ValueError:
-        return default
-
-
-def _django_query(
+def _pg_query(
     *,
     user_id: str | None,
     pay_ways: list[str],
@@ -51,81 +25,69 @@ def _django_query(
     pgsql_database: str,
 ) -> dict:
     """
-    Minimal Django ORM query (standalone; Roadmap-only script).
+    Single raw SQL aggregate over finished orders (standalone; Roadmap-only script).
 
     Dependencies:
-      - Django
       - psycopg2-binary (or psycopg2)
-    """
-    import django  # type: ignore
-    from django.conf import settings  # type: ignore
-
-    if not settings.configured:
-        settings.configure(
-            SECRET_KEY="revenue-snapshot",
-            INSTALLED_APPS=["django.contrib.contenttypes"],
-            DATABASES={
-                "default": {
-                    "ENGINE": "django.db.backends.postgresql",
-                    "NAME": pgsql_database,
-                    "USER": pgsql_user,
-                    "PASSWORD": pgsql_password or "",
-                    "HOST": pgsql_host,
-                    "PORT": pgsql_port,
-                }
-            },
-            TIME_ZONE="UTC",
-            USE_TZ=True,
-            DEFAULT_AUTO_FIELD="django.db.models.AutoField",
-        )
-
-    django.setup()
 
-    from django.db import models  # type: ignore
-    from django.db.models import Sum  # type: ignore
-    from django.utils import timezone as dj_tz  # type: ignore
-
-    class OrderState:
-        FINISHED = "Finished"
-
-    class Order(models.Model):
-        id = models.UUIDField(primary_key=True)
-        created_at = models.DateTimeField()
-        price = models.FloatField(null=True)
-        state = models.CharField(max_length=20, null=True)
-        user_id = models.CharField(max_length=40, null=True)
-        pay_way = models.CharField(max_length=20, null=True)
-
-        class Meta:
-            managed = False
-            db_table = orders_table
-            app_label = "revenue_snapshot"
-
-    now = dj_tz.now()
-    start_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    start_7d = now - timedelta(days=7)
-    start_30d = now - timedelta(days=30)
-    start_90d = now - timedelta(days=90)
+    Indexes:
+      - (state, created_at DESC), see scripts/sql/create_order_indexes.sql
+    """
+    import psycopg2  # type: ignore
+    from psycopg2 import sql  # type: ignore
+
+    now = datetime.now(timezone.utc)
+    params = {
+        "now": now,
+        "start_7d": now - timedelta(days=7),
+        "start_30d": now - timedelta(days=30),
+        "start_90d": now - timedelta(days=90),
+    }
 
-    qs = Order.objects.filter(state=OrderState.FINISHED)
+    conditions = [
+        sql.SQL("state = 'Finished'"),
+        sql.SQL("created_at >= %(start_90d)s"),
+        sql.SQL("created_at <= %(now)s"),
+    ]
     if user_id:
-        qs = qs.filter(user_id=user_id)
+        conditions.append(sql.SQL("user_id = %(user_id)s"))
+        params["user_id"] = user_id
     if pay_ways:
-        qs = qs.filter(pay_way__in=pay_ways)
-
-    def _sum_between(start_dt):
-        return (
-            qs.filter(created_at__gte=start_dt, created_at__lte=now)
-            .aggregate(total=Sum("price"))
-            .get("total")
-            or 0
-        )
+        conditions.append(sql.SQL("pay_way = ANY(%(pay_ways)s)"))
+        params["pay_ways"] = pay_ways
+
+    # One scan over the widest window; narrower windows are filtered aggregates.
+    query = sql.SQL(
+        "SELECT"
+        " SUM(price) FILTER (WHERE created_at >= %(start_7d)s) AS last_7d,"
+        " SUM(price) FILTER (WHERE created_at >= %(start_30d)s) AS last_30d,"
+        " SUM(price) AS last_90d"
+        " FROM {table} WHERE {where}"
+    ).format(
+        table=sql.Identifier(*orders_table.split(".")),
+        where=sql.SQL(" AND ").join(conditions),
+    )
+
+    conn = psycopg2.connect(
+        host=pgsql_host,
+        port=pgsql_port,
+        user=pgsql_user,
+        password=pgsql_password or "",
+        dbname=pgsql_database,
+        options="-c TimeZone=UTC",
+    )
+    try:
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            last_7d, last_30d, last_90d = cur.fetchone()
+    finally:
+        conn.close()
 
     return {
         "as_of": now.isoformat(),
-        "last_7d": _sum_between(start_7d),
-        "last_30d": _sum_between(start_30d),
-        "last_90d": _sum_between(start_90d),
+        "last_7d": float(last_7d) if last_7d else 0,
+        "last_30d": float(last_30d) if last_30d else 0,
+        "last_90d": float(last_90d) if last_90d else 0,
     }
 
 
@@ -159,35 +121,35 @@ def main() -> int:
     )
     parser.add_argument(
         "--pgsql-host",
-        default=_env_str("PGSQL_HOST", "localhost"),
+        default=env_str("PGSQL_HOST", "localhost"),
         help="Postgres host (default: $PGSQL_HOST or localhost)",
     )
     parser.add_argument(
         "--pgsql-port",
         type=int,
-        default=_env_int("PGSQL_PORT", 5432),
+        default=env_int("PGSQL_PORT", 5432),
         help="Postgres port (default: $PGSQL_PORT or 5432)",
     )
     parser.add_argument(
         "--pgsql-user",
-        default=_env_str("PGSQL_USER", "postgres"),
+        default=env_str("PGSQL_USER", "postgres"),
         help="Postgres user (default: $PGSQL_USER or postgres)",
     )
     parser.add_argument(
         "--pgsql-password",
-        default=_env_str("PGSQL_PASSWORD"),
+        default=env_str("PGSQL_PASSWORD"),
         help="Postgres password (default: $PGSQL_PASSWORD)",
     )
     parser.add_argument(
         "--pgsql-database",
-        default=_env_str("PGSQL_DATABASE", "acedatacloud_platform"),
+        default=env_str("PGSQL_DATABASE", "acedatacloud_platform"),
         help="Postgres database (default: $PGSQL_DATABASE or acedatacloud_platform)",
     )
     args = parser.parse_args()
 
     pay_ways = [str(p).strip() for p in (args.pay_ways or []) if str(p).strip()]
     try:
-        orm = _django_query(
+        totals = _pg_query(
             user_id=args.user_id,
             pay_ways=pay_ways,
             orders_table=str(args.orders_table).strip() or "app_order",
@@ -199,8 +161,8 @@ def main() -> int:
         )
     except Exception as exc:
         print(
-            "[revenue_snapshot] Failed to query Postgres via Django ORM.\n"
-            "  - Install deps: `pip install Django psycopg2-binary`\n"
+            "[revenue_snapshot] Failed to query Postgres.\n"
+            "  - Install deps: `pip install psycopg2-binary`\n"
             "  - Export PGSQL_HOST/PGSQL_PORT/PGSQL_USER/PGSQL_PASSWORD/PGSQL_DATABASE\n"
             f"  - Error: {exc}",
             file=sys.stderr,
@@ -208,12 +170,12 @@ def main() -> int:
         return 2
 
     payload = {
-        "as_of": orm["as_of"],
+        "as_of": totals["as_of"],
         "currency": str(args.currency),
-        **{k: orm[k] for k in ("last_7d", "last_30d", "last_90d")},
+        **{k: totals[k] for k in ("last_7d", "last_30d", "last_90d")},
     }
 
-    _atomic_write_json(Path(args.output), payload)
+    atomic_write_json(Path(args.output), payload)
     print(f"[revenue_snapshot] Wrote {args.output}")
     return 0
 
@@ -12,47 +12,24 @@ Usage:
 
     # Custom start month
     python3 scripts/generate_revenue_trend.py --start-month 2026-01
+
+The month scan relies on the (state, created_at DESC) index from
+``scripts/sql/create_order_indexes.sql``.
 """
 
 import argparse
-import json
-import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+from _common import atomic_write_json, env_str, env_int
+
 
 def _default_output_path() -> Path:
     root = Path(__file__).resolve().parent.parent
     return root / "config" / "revenue_trend.json"
 
 
-def _atomic_write_json(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
-    )
-    tmp.replace(path)
-
-
-def _env_str(key: str, default: str | None = None) -> str | None:
-    val = os.environ.get(key)
-    if val is None or not str(val).strip():
-        return default
-    return str(val).strip()
-
-
-def _env_int(key: str, default: int) -> int:
-    val = _env_str(key)
-    if val is None:
-        return default
-    try:
-        return int(val)
-    except ValueError:
-        return default
-
-
 def _parse_month(value: str) -> datetime:
     """Parse a ``YYYY-MM`` string into a UTC datetime at the 1st of that month."""
     parts = str(value).strip().split("-")
@@ -89,7 +66,9 @@ def _django_query(
     if not settings.configured:
         settings.configure(
             SECRET_KEY="revenue-trend-snapshot",
-            INSTALLED_APPS=["django.contrib.contenttypes"],
+            # No apps: the unmanaged model below declares its own app_label,
+            # so contenttypes (and its setup cost) is not needed.
+            INSTALLED_APPS=[],
             DATABASES={
                 "default": {
                     "ENGINE": "django.db.backends.postgresql",
@@ -102,7 +81,6 @@ def _django_query(
             },
             TIME_ZONE="UTC",
             USE_TZ=True,
-            DEFAULT_AUTO_FIELD="django.db.models.AutoField",
         )
 
     django.setup()
@@ -182,7 +160,7 @@ def main() -> int:
     parser.add_argument(
         "--start-month",
         dest="start_month",
-        default=_env_str("REVENUE_TREND_START_MONTH", "2026-01"),
+        default=env_str("REVENUE_TREND_START_MONTH", "2026-01"),
         help="Inclusive start month, YYYY-MM (default: 2026-01)",
     )
     parser.add_argument(
@@ -202,28 +180,28 @@ def main() -> int:
     )
     parser.add_argument(
         "--pgsql-host",
-        default=_env_str("PGSQL_HOST", "localhost"),
+        default=env_str("PGSQL_HOST", "localhost"),
         help="Postgres host (default: $PGSQL_HOST or localhost)",
     )
     parser.add_argument(
         "--pgsql-port",
         type=int,
-        default=_env_int("PGSQL_PORT", 5432),
+        default=env_int("PGSQL_PORT", 5432),
         help="Postgres port (default: $PGSQL_PORT or 5432)",
     )
     parser.add_argument(
         "--pgsql-user",
-        default=_env_str("PGSQL_USER", "postgres"),
+        default=env_str("PGSQL_USER", "postgres"),
         help="Postgres user (default: $PGSQL_USER or postgres)",
     )
     parser.add_argument(
         "--pgsql-password",
-        default=_env_str("PGSQL_PASSWORD"),
+        default=env_str("PGSQL_PASSWORD"),
         help="Postgres password (default: $PGSQL_PASSWORD)",
     )
     parser.add_argument(
         "--pgsql-database",
-        default=_env_str("PGSQL_DATABASE", "acedatacloud_platform"),
+        default=env_str("PGSQL_DATABASE", "acedatacloud_platform"),
         help="Postgres database (default: $PGSQL_DATABASE or acedatacloud_platform)",
     )
     args = parser.parse_args()
@@ -264,7 +242,7 @@ def main() -> int:
         "months": orm["months"],
     }
 
-    _atomic_write_json(Path(args.output), payload)
+    atomic_write_json(Path(args.output), payload)
     print(f"[revenue_trend] Wrote {args.output} ({len(orm['months'])} months)")
     return 0
 
@@ -0,0 +1,16 @@
+-- Indexes backing the Roadmap order snapshots.
+--
+-- generate_recent_orders.py, generate_revenue_snapshot.py and
+-- generate_revenue_trend.py all filter finished orders by state and then
+-- range-scan or sort on created_at. Without a composite index Postgres falls
+-- back to a sequential scan (plus a sort for the recent-orders LIMIT).
+--
+-- Run once against the platform database (outside a transaction, since
+-- CONCURRENTLY cannot run inside one):
+--
+--   psql "$PGSQL_DATABASE" -f scripts/sql/create_order_indexes.sql
+--
+-- Adjust the table name if the scripts run with --orders-table.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_app_order_state_created_at
+    ON app_order (state, created_at DESC);
@@ -2,15 +2,25 @@
 from __future__ import annotations
 
 import argparse
+import base64
 import datetime as dt
+import functools
+import gzip
 import hashlib
+import http.client
+import itertools
 import json
 import os
 import re
 import ssl
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 import urllib.parse
 import urllib.request
 
@@ -19,10 +29,19 @@ try:
 except Exception:  # pragma: no cover
     certifi = None
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+from _common import atomic_write_json, env_int
+
 
 GITHUB_API = "https://api.github.com"
 OPENAI_DEFAULT_BASE_URL = "https://api.acedata.cloud"
 COPILOT_BOT_LOGIN = "copilot"  # GitHub Copilot bot username for exclusion bypass logic
+PR_FETCH_WORKERS = 8  # Default concurrent per-PR fetch/summarize workers (--concurrency / PR_SYNC_CONCURRENCY)
+PAGE_FETCH_WORKERS = 8  # Concurrent page fetches once the last page is known
 
 
 def _normalize_base_url(value: str) -> str:
@@ -47,29 +66,57 @@ def _log(verbose: bool, message: str) -> None:
         print(message, file=sys.stderr)
 
 
+# Python 3.11+ parses a trailing "Z" natively (and returns timezone.utc), so GitHub's canonical
+# "2026-08-08T16:01:39Z" can go straight to the C parser without the strip/rewrite/astimezone steps.
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+_UTC = dt.timezone.utc
+
+
 def _parse_iso_datetime(value: str) -> dt.datetime:
+    if _FROMISOFORMAT_ACCEPTS_Z and len(value) == 20 and value[19] == "Z":
+        return dt.datetime.fromisoformat(value)
     value = value.strip()
     if value.endswith("Z"):
-        value = value[:-1] + "+00:00"
+        # Already UTC: tag it instead of rewriting the suffix and converting.
+        return dt.datetime.fromisoformat(value[:-1]).replace(tzinfo=_UTC)
     parsed = dt.datetime.fromisoformat(value)
     if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=dt.timezone.utc)
-    return parsed.astimezone(dt.timezone.utc)
+        return parsed.replace(tzinfo=_UTC)
+    if parsed.tzinfo is _UTC:
+        return parsed
+    return parsed.astimezone(_UTC)
 
 
 def _utc_now() -> dt.datetime:
-    return dt.datetime.now(dt.timezone.utc)
+    return dt.datetime.now(_UTC)
+
+
+# Request bodies are machine-read: no indentation/padding, and UTF-8 instead of \uXXXX escapes, which matters
+# once the PR payload is embedded as a string inside the chat request and gets escaped a second time.
+_COMPACT_JSON = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_dumps_compact(obj: Any) -> bytes:
+    # orjson's default output is exactly this compact UTF-8 form, produced straight to bytes.
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _COMPACT_JSON.encode(obj).encode("utf-8")
+
+
+# orjson parses straight from bytes and is several times faster; both raise ValueError subclasses.
+_json_loads: Callable[[bytes | str], Any] = orjson.loads if orjson is not None else json.loads
 
 
 def _read_json(path: str) -> dict:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _json_loads(Path(path).read_bytes())
 
 
 def _write_json(path: str, data: dict) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-        f.write("\n")
+    # Temp file + rename, so an interrupted run never leaves a truncated day/index/state file.
+    atomic_write_json(Path(path), data)
+
 
 def _ssl_context() -> ssl.SSLContext:
     try:
@@ -83,56 +130,282 @@ def _ssl_context() -> ssl.SSLContext:
 _URL_CONTEXT = _ssl_context()
 
 
-def _github_get(
+# Keep-alive connections, one set per thread (http.client connections are not thread-safe).
+_HTTP_LOCAL = threading.local()
+_HTTP_MAX_REDIRECTS = 5
+_HTTP_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+
+@functools.lru_cache(maxsize=None)
+def _http_proxy(scheme: str, netloc: str) -> tuple[str, int, dict[str, str]] | None:
+    """
+    Returns (host, port, headers) of the proxy to use for `scheme://netloc`, or None to connect directly.
+
+    Honors HTTP(S)_PROXY / NO_PROXY the way urllib.request.urlopen does; headers carry Proxy-Authorization
+    when the proxy URL has credentials.
+    """
+    proxy = urllib.request.getproxies().get(scheme)
+    host = urllib.parse.urlsplit(f"//{netloc}").hostname or netloc
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    if not parts.hostname:
+        return None
+    headers: dict[str, str] = {}
+    if parts.username:
+        creds = f"{urllib.parse.unquote(parts.username)}:{urllib.parse.unquote(parts.password or '')}"
+        headers["Proxy-Authorization"] = "Basic " + base64.b64encode(creds.encode("utf-8")).decode("ascii")
+    return parts.hostname, parts.port or 80, headers
+
+
+def _http_connection(scheme: str, netloc: str, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+    conns: dict[tuple[str, str], http.client.HTTPConnection] | None = getattr(_HTTP_LOCAL, "conns", None)
+    if conns is None:
+        conns = _HTTP_LOCAL.conns = {}
+    conn = conns.get((scheme, netloc))
+    if conn is not None:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+    proxy = _http_proxy(scheme, netloc)
+    if scheme == "https" and proxy is not None:
+        # TLS straight through to the origin over a CONNECT tunnel, like urllib's proxy handler.
+        proxy_host, proxy_port, proxy_headers = proxy
+        conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=timeout, context=_URL_CONTEXT)
+        target = urllib.parse.urlsplit(f"//{netloc}")
+        conn.set_tunnel(target.hostname or netloc, target.port or 443, headers=proxy_headers or None)
+    elif scheme == "https":
+        conn = http.client.HTTPSConnection(netloc, timeout=timeout, context=_URL_CONTEXT)
+    elif proxy is not None:
+        # Plain HTTP goes to the proxy itself, with absolute-form request targets (see `_http_open`).
+        conn = http.client.HTTPConnection(proxy[0], proxy[1], timeout=timeout)
+    else:
+        conn = http.client.HTTPConnection(netloc, timeout=timeout)
+    conns[(scheme, netloc)] = conn
+    return conn, False
+
+
+def _http_drop_connection(scheme: str, netloc: str) -> None:
+    conns = getattr(_HTTP_LOCAL, "conns", None) or {}
+    conn = conns.pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def _http_open(
+    method: str,
     url: str,
-    token: str | None,
     *,
-    accept: str = "application/vnd.github+json",
-) -> tuple[dict, dict]:
-    headers = {
-        "Accept": accept,
-        "User-Agent": "AceDataCloud-Roadmap-PR-Sync",
-    }
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+    headers: dict[str, str],
+    body: bytes | None = None,
+    timeout: float = 30,
+) -> http.client.HTTPResponse:
+    """
+    Sends a request over a pooled keep-alive connection and returns the response with its body unread.
+
+    The caller must either read the body to the end (so the connection can be reused) or drop the connection.
+    A connection the server has silently closed is retried once on a fresh one, but a non-idempotent request
+    (e.g. an OpenAI completion POST) only when it failed before being sent in full: once the server may have
+    accepted it, resending could run (and bill) it twice.
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    proxy = _http_proxy(parts.scheme, parts.netloc) if parts.scheme == "http" else None
+    if proxy is not None:
+        # A plain-HTTP proxy takes the absolute URL as the request target.
+        path = f"http://{parts.netloc}{path}"
+        headers = {**headers, **proxy[2]}
+    while True:
+        conn, reused = _http_connection(parts.scheme, parts.netloc, timeout)
+        sent = False
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            sent = True
+            return conn.getresponse()
+        except (http.client.HTTPException, ConnectionError):
+            _http_drop_connection(parts.scheme, parts.netloc)
+            if reused and (not sent or method in _HTTP_IDEMPOTENT_METHODS):
+                continue
+            raise
+        except Exception:
+            _http_drop_connection(parts.scheme, parts.netloc)
+            raise
+
+
+def _http_request(
+    method: str,
+    url: str,
+    *,
+    headers: dict[str, str],
+    body: bytes | None = None,
+    timeout: float = 30,
+) -> tuple[int, dict[str, str], bytes]:
+    """
+    Performs a request over a pooled keep-alive connection and returns (status, headers, body).
+
+    The response is requested gzip-compressed and the body returned decoded. GET redirects are followed like
+    urllib did.
+    """
+    headers = {"Accept-Encoding": "gzip", **headers}
+    for _redirect in range(_HTTP_MAX_REDIRECTS + 1):
+        parts = urllib.parse.urlsplit(url)
+        resp = _http_open(method, url, headers=headers, body=body, timeout=timeout)
+        try:
+            data = resp.read()
+        except Exception:
+            _http_drop_connection(parts.scheme, parts.netloc)
+            raise
+        if resp.will_close:
+            _http_drop_connection(parts.scheme, parts.netloc)
+        resp_headers = dict(resp.getheaders())
+        if data and (resp.getheader("Content-Encoding") or "").strip().lower() == "gzip":
+            data = gzip.decompress(data)
+        location = resp.getheader("Location")
+        if method == "GET" and resp.status in (301, 302, 303, 307, 308) and location:
+            url = urllib.parse.urljoin(url, location)
+            continue
+        return resp.status, resp_headers, data
+    raise RuntimeError(f"Too many redirects for {url}")
 
-    req = urllib.request.Request(url, headers=headers, method="GET")
+
+def _header(headers: dict[str, str], name: str) -> str | None:
+    name = name.lower()
+    for k, v in headers.items():
+        if k.lower() == name:
+            return v
+    return None
+
+
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_MAX_SLEEP_SECONDS = 60.0
+_RATE_LIMIT_LOW_WATERMARK = 5
+# Below this many remaining core requests, per-PR work is no longer fanned out (see main).
+_RATE_LIMIT_SERIAL_BELOW = 200
+# Last X-RateLimit-Remaining seen per X-RateLimit-Resource ("core", "search", "graphql", ...). The search API
+# has its own small quota, so only "core" says anything about the per-PR REST calls.
+_rate_limit_remaining: dict[str, int] = {}
+
+
+def _core_quota_low() -> bool:
+    remaining = _rate_limit_remaining.get("core")
+    return remaining is not None and remaining < _RATE_LIMIT_SERIAL_BELOW
+
+
+def _rate_limit_reset_wait(headers: dict[str, str]) -> float:
+    reset = _header(headers, "X-RateLimit-Reset")
     try:
-        with urllib.request.urlopen(req, timeout=30, context=_URL_CONTEXT) as resp:
-            body = resp.read().decode("utf-8")
-            return json.loads(body), dict(resp.headers.items())
-    except urllib.error.HTTPError as e:
-        details = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
-        raise RuntimeError(f"GitHub API error {e.code} for {url}: {details}") from e
+        wait = float(reset) - time.time() if reset else 1.0
+    except ValueError:
+        wait = 1.0
+    return min(max(wait, 1.0), _RATE_LIMIT_MAX_SLEEP_SECONDS)
 
 
-def _github_get_text(url: str, token: str | None, *, accept: str) -> tuple[str, dict]:
+def _rate_limit_wait(status: int, headers: dict[str, str]) -> float | None:
+    """Seconds to wait before retrying a rate-limited (403/429) response, or None if it wasn't one."""
+    if status not in (403, 429):
+        return None
+    retry_after = _header(headers, "Retry-After")
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), _RATE_LIMIT_MAX_SLEEP_SECONDS)
+        except ValueError:
+            return 1.0
+    if _header(headers, "X-RateLimit-Remaining") == "0":
+        return _rate_limit_reset_wait(headers)
+    # A plain 403 is a permission error, not throttling.
+    return None
+
+
+def _github_fetch(
+    url: str,
+    token: str | None,
+    *,
+    accept: str,
+    method: str = "GET",
+    body: bytes | None = None,
+) -> tuple[int, dict, bytes]:
+    """
+    Performs a GitHub API request with the rate-limit handling shared by REST and GraphQL calls.
+
+    Throttled (403/429) responses are retried after Retry-After / the reset time, and a nearly exhausted
+    quota pauses until it resets.
+    """
     headers = {
         "Accept": accept,
         "User-Agent": "AceDataCloud-Roadmap-PR-Sync",
     }
     if token:
         headers["Authorization"] = f"Bearer {token}"
+    if body is not None:
+        headers["Content-Type"] = "application/json"
+
+    for attempt in range(_RATE_LIMIT_RETRIES + 1):
+        status, resp_headers, data = _http_request(method, url, headers=headers, body=body, timeout=30)
+        wait = _rate_limit_wait(status, resp_headers)
+        if wait is not None and attempt < _RATE_LIMIT_RETRIES:
+            time.sleep(wait)
+            continue
+        break
+    if status >= 400:
+        details = data.decode("utf-8", errors="replace")
+        raise RuntimeError(f"GitHub API error {status} for {url}: {details}")
+
+    # Close to exhausting this resource's quota: pause until it resets rather than failing mid-run.
+    remaining = _header(resp_headers, "X-RateLimit-Remaining")
+    if remaining is not None and remaining.isdigit():
+        resource = _header(resp_headers, "X-RateLimit-Resource") or "core"
+        _rate_limit_remaining[resource] = int(remaining)
+        if int(remaining) < _RATE_LIMIT_LOW_WATERMARK:
+            time.sleep(_rate_limit_reset_wait(resp_headers))
+    return status, resp_headers, data
+
 
-    req = urllib.request.Request(url, headers=headers, method="GET")
+def _github_get(
+    url: str,
+    token: str | None,
+    *,
+    accept: str = "application/vnd.github+json",
+) -> tuple[dict, dict]:
+    _status, headers, data = _github_fetch(url, token, accept=accept)
+    # Parse the UTF-8 bytes directly; skip materializing a decoded copy of the body.
+    return _json_loads(data), headers
+
+
+def _github_prime_rate_limit(token: str | None, *, verbose: bool) -> None:
+    """Records the core quota from GET /rate_limit, which does not count against any quota itself."""
     try:
-        with urllib.request.urlopen(req, timeout=30, context=_URL_CONTEXT) as resp:
-            body = resp.read().decode("utf-8", errors="replace")
-            return body, dict(resp.headers.items())
-    except urllib.error.HTTPError as e:
-        details = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
-        raise RuntimeError(f"GitHub API error {e.code} for {url}: {details}") from e
+        payload, _headers = _github_get(f"{GITHUB_API}/rate_limit", token)
+    except Exception as e:
+        _log(verbose, f"warn: rate limit lookup failed: {e}")
+        return
+    resources = payload.get("resources") if isinstance(payload, dict) else None
+    core = resources.get("core") if isinstance(resources, dict) else None
+    remaining = core.get("remaining") if isinstance(core, dict) else None
+    if isinstance(remaining, int):
+        _rate_limit_remaining["core"] = remaining
+
+
+def _github_get_text(url: str, token: str | None, *, accept: str) -> tuple[str, dict]:
+    _status, headers, data = _github_fetch(url, token, accept=accept)
+    return data.decode("utf-8", errors="replace"), headers
 
 
-_PULL_URL_RE = re.compile(r"^https://github\.com/([^/]+)/([^/]+)/pull/(\d+)(?:/.*)?$")
+_PULL_URL_PREFIX = "https://github.com/"
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_pull_url(html_url: str) -> tuple[str, str, int] | None:
-    m = _PULL_URL_RE.match(html_url.strip())
-    if not m:
+    # https://github.com/<owner>/<repo>/pull/<number>[/...]; callers pass an already-stripped url.
+    if not html_url.startswith(_PULL_URL_PREFIX):
+        return None
+    parts = html_url[len(_PULL_URL_PREFIX) :].split("/", 4)
+    if len(parts) < 4 or not parts[0] or not parts[1] or parts[2] != "pull":
         return None
-    owner, repo, number = m.group(1), m.group(2), int(m.group(3))
-    return owner, repo, number
+    number = parts[3]
+    if not number.isdecimal():
+        return None
+    return parts[0], parts[1], int(number)
 
 
 def _load_state(state_path: str, bootstrap_days: int) -> dt.datetime:
@@ -165,9 +438,9 @@ def _save_state(
     _write_json(
         state_path,
         {
-            "last_sync": last_sync.astimezone(dt.timezone.utc).isoformat().replace("+00:00", "Z"),
-            "last_pr_sync": last_pr_sync.astimezone(dt.timezone.utc).isoformat().replace("+00:00", "Z"),
-            "last_run_at": last_run_at.astimezone(dt.timezone.utc).isoformat().replace("+00:00", "Z"),
+            "last_sync": last_sync.astimezone(_UTC).isoformat().replace("+00:00", "Z"),
+            "last_pr_sync": last_pr_sync.astimezone(_UTC).isoformat().replace("+00:00", "Z"),
+            "last_run_at": last_run_at.astimezone(_UTC).isoformat().replace("+00:00", "Z"),
             "last_added_urls": added_urls[:50],
             "openai": {
                 "enabled": bool(openai_enabled),
@@ -178,6 +451,70 @@ def _save_state(
     )
 
 
+_LINK_LAST_RE = re.compile(r'<([^>]*)>;\s*rel="last"')
+
+
+def _link_last_page(headers: dict[str, str]) -> int | None:
+    link = _header(headers, "Link")
+    if not link:
+        return None
+    m = _LINK_LAST_RE.search(link)
+    if not m:
+        return None
+    page = urllib.parse.parse_qs(urllib.parse.urlsplit(m.group(1)).query).get("page")
+    try:
+        return int(page[0]) if page else None
+    except ValueError:
+        return None
+
+
+def _github_pages(
+    page_url: Callable[[int], str],
+    token: str | None,
+    *,
+    max_pages: int,
+    has_more: Callable[[Any], bool] | None = None,
+    fetch_all: bool = False,
+) -> Iterator[Any]:
+    """
+    Yields page payloads in order.
+
+    Paging is lazy: while the caller consumes page N, only page N+1 is requested in the background, and only
+    if `has_more(page N)` says another page is needed. Closing the generator cancels a prefetch that hasn't
+    started, so at most one page is fetched past where the caller stopped.
+
+    With `fetch_all` (callers that read every page anyway) and a Link header advertising the last page,
+    pages 2..last are fetched concurrently instead.
+    """
+    payload, headers = _github_get(page_url(1), token)
+    last = _link_last_page(headers)
+    stop = max_pages if last is None else min(last, max_pages)
+
+    if fetch_all and last is not None:
+        yield payload
+        pages = range(2, stop + 1)
+        if not pages:
+            return
+        with ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, len(pages))) as executor:
+            yield from executor.map(lambda page: _github_get(page_url(page), token)[0], pages)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        page = 1
+        while True:
+            pending = None
+            if page < stop and (has_more is None or has_more(payload)):
+                pending = executor.submit(_github_get, page_url(page + 1), token)
+            yield payload
+            if pending is None:
+                return
+            payload, _headers = pending.result()
+            page += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def _search_merged_prs(
     *,
     org: str,
@@ -185,16 +522,23 @@ def _search_merged_prs(
     token: str | None,
     max_items: int,
     exclude_repos: list[str] | None = None,
-) -> list[dict]:
-    items: list[dict] = []
-    page = 1
+    updated_after: dt.datetime | None = None,
+) -> Iterator[dict]:
+    """
+    Yields merged PRs, most recently updated first, fetching further pages only as the caller keeps consuming.
+
+    With `updated_after`, paging stops once a page ends at or before that time: merging updates a PR, so
+    anything further down the list was merged no later than the cursor.
+    """
+    yielded = 0
     per_page = 100
 
     exclude = ""
     if exclude_repos:
         exclude = " " + " ".join(f"-repo:{org}/{r}" for r in exclude_repos if str(r or "").strip())
     query = f"org:{org} is:pr is:merged merged:>={since_date}{exclude}"
-    while len(items) < max_items:
+
+    def page_url(page: int) -> str:
         params = {
             "q": query,
             "sort": "updated",
@@ -202,27 +546,63 @@ def _search_merged_prs(
             "per_page": str(per_page),
             "page": str(page),
         }
-        url = f"{GITHUB_API}/search/issues?{urllib.parse.urlencode(params)}"
-        payload, _headers = _github_get(url, token)
+        return f"{GITHUB_API}/search/issues?{urllib.parse.urlencode(params)}"
+
+    def has_more(payload: Any) -> bool:
+        # Decided from the page itself, so the next page is only requested when it can contribute.
+        page_items = payload.get("items") if isinstance(payload, dict) else None
+        if not isinstance(page_items, list) or len(page_items) < per_page:
+            return False
+        last_updated = page_items[-1].get("updated_at") if isinstance(page_items[-1], dict) else None
+        return not (
+            updated_after is not None and last_updated and _parse_iso_datetime(str(last_updated)) <= updated_after
+        )
+
+    for payload in _github_pages(page_url, token, max_pages=-(-max_items // per_page), has_more=has_more):
         page_items = payload.get("items") or []
         if not page_items:
             break
 
-        items.extend(page_items)
-        if len(page_items) < per_page:
+        page_items = page_items[: max_items - yielded]
+        yield from page_items
+        yielded += len(page_items)
+        if yielded >= max_items:
             break
-        page += 1
 
-    return items[:max_items]
-def _github_list(url: str, token: str | None, *, max_items: int = 5000) -> list[dict]:
+
+@dataclass(slots=True)
+class _PrCandidate:
+    """A search result that passed the local filters, with the fields later steps need already extracted."""
+
+    pr: dict
+    html_url: str
+    repo: str
+    number: int
+    key: str
+    merged_at: dt.datetime
+    author_login: str | None
+
+
+def _github_list(
+    url: str,
+    token: str | None,
+    *,
+    max_items: int = 5000,
+) -> list[dict]:
     items: list[dict] = []
-    page = 1
     per_page = 100
-
-    while len(items) < max_items:
-        sep = "&" if "?" in url else "?"
-        page_url = f"{url}{sep}per_page={per_page}&page={page}"
-        payload, _headers = _github_get(page_url, token)
+    sep = "&" if "?" in url else "?"
+
+    def page_url(page: int) -> str:
+        return f"{url}{sep}per_page={per_page}&page={page}"
+
+    for payload in _github_pages(
+        page_url,
+        token,
+        max_pages=-(-max_items // per_page),
+        has_more=lambda payload: isinstance(payload, list) and len(payload) >= per_page,
+        fetch_all=True,
+    ):
         if not isinstance(payload, list) or not payload:
             break
         for it in payload:
@@ -230,14 +610,18 @@ def _github_list(url: str, token: str | None, *, max_items: int = 5000) -> list[
                 items.append(it)
                 if len(items) >= max_items:
                     break
-        if len(payload) < per_page:
+        if len(items) >= max_items or len(payload) < per_page:
             break
-        page += 1
 
     return items
 
 
-def _github_get_allowed_logins(*, org: str, token: str | None, verbose: bool) -> set[str]:
+def _github_get_allowed_logins(
+    *,
+    org: str,
+    token: str | None,
+    verbose: bool,
+) -> set[str]:
     allowed: set[str] = set()
 
     try:
@@ -258,11 +642,24 @@ def _github_get_allowed_logins(*, org: str, token: str | None, verbose: bool) ->
     allowed.discard("")
     return allowed
 
-_DAY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# fullmatch already anchors both ends; the bound method skips the attribute lookup per call.
+_DAY_FULLMATCH = re.compile(r"\d{4}-\d{2}-\d{2}").fullmatch
+
+_DEFAULT_INDEX: dict[str, Any] = {
+    "$schema": "./index.schema.json",
+    "title": "Daily Updates",
+    "subtitle": "",
+    "initial_open_days": 3,
+    "page_size_days": 20,
+    "days": [],
+}
 
 
+@functools.lru_cache(maxsize=4096)
 def _is_day(value: str) -> bool:
-    return bool(_DAY_RE.match(value.strip()))
+    # Callers pass already-stripped values (or file stems).
+    return _DAY_FULLMATCH(value) is not None
 
 
 def _coerce_daily_updates_index(doc: dict) -> dict:
@@ -300,6 +697,33 @@ def _coerce_daily_updates_index(doc: dict) -> dict:
     return doc
 
 
+_DAY_KEY_RE = re.compile(r'"(id|url)"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+
+def _scan_day_keys(raw: str) -> set[str]:
+    """
+    Collects item ids from a day file's raw text without building its object tree.
+
+    Mirrors the id derivation in `_coerce_daily_day`: an item without an id is keyed by its PR url.
+    Keys are interned, like the candidate keys probed against them in main, so a hit compares by identity.
+    """
+    keys: set[str] = set()
+    for field, value in _DAY_KEY_RE.findall(raw):
+        if "\\" in value:
+            value = json.loads(f'"{value}"')
+        value = value.strip()
+        if not value:
+            continue
+        if field == "id":
+            keys.add(sys.intern(value))
+            continue
+        parsed_pr = _parse_pull_url(value)
+        if parsed_pr:
+            o, r, n = parsed_pr
+            keys.add(sys.intern(f"gh:pr:{o}/{r}#{n}"))
+    return keys
+
+
 def _coerce_daily_day(doc: dict, *, day: str) -> list[dict]:
     if not isinstance(doc, dict):
         raise ValueError(f"{day}.json must be a JSON object")
@@ -317,8 +741,10 @@ def _coerce_daily_day(doc: dict, *, day: str) -> list[dict]:
         tags: list[str] = []
         if isinstance(tags_raw, list):
             for t in tags_raw:
-                if isinstance(t, str) and t.strip():
-                    tags.append(t.strip())
+                if isinstance(t, str):
+                    t = t.strip()
+                    if t:
+                        tags.append(t)
         if not title:
             continue
         if not item_id:
@@ -346,30 +772,38 @@ def _coerce_daily_day(doc: dict, *, day: str) -> list[dict]:
     return out
 
 
+_REPO_DISPLAY_NAMES = {
+    "platformfrontend": "Frontend Web",
+    "authfrontend": "Frontend Web",
+    "platformbackend": "Backend",
+    "authbackend": "Backend",
+    "platformservice": "Platform Service",
+    "platformgateway": "Gateway",
+    "platformpublisher": "Publisher",
+    "platformregister": "Register",
+    "proxypool": "Proxy",
+    "dify": "Dify",
+    "facilitatorx402": "x402",
+}
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<!^)([A-Z])")
+# Hoisted verbatim from the original inline pattern. Note the doubled backslash: in this raw string "\\s"
+# matches a literal backslash and "s", so it only fires on text containing backslashes. Fixing it would
+# change the generated titles, which is out of scope for the hoist.
+_WHITESPACE_RE = re.compile(r"\\s+")
+
+
 def _repo_display_name(repo: str) -> str:
     # Keep Nexior as-is; everything else should be more human-friendly.
-    if repo.lower() == "nexior":
+    repo_lower = repo.lower()
+    if repo_lower == "nexior":
         return "Nexior"
-    mapping = {
-        "platformfrontend": "Frontend Web",
-        "authfrontend": "Frontend Web",
-        "platformbackend": "Backend",
-        "authbackend": "Backend",
-        "platformservice": "Platform Service",
-        "platformgateway": "Gateway",
-        "platformpublisher": "Publisher",
-        "platformregister": "Register",
-        "proxypool": "Proxy",
-        "dify": "Dify",
-        "facilitatorx402": "x402",
-    }
-    if repo.lower() in mapping:
-        return mapping[repo.lower()]
+    if repo_lower in _REPO_DISPLAY_NAMES:
+        return _REPO_DISPLAY_NAMES[repo_lower]
 
     # Try to humanize repo names like "SunoAPI" -> "Suno API".
     name = repo.replace("_", " ").replace("-", " ").strip()
-    name = re.sub(r"(?<!^)([A-Z])", r" \1", name).strip()
-    name = re.sub(r"\\s+", " ", name).strip()
+    name = _CAMEL_BOUNDARY_RE.sub(r" \1", name).strip()
+    name = _WHITESPACE_RE.sub(" ", name).strip()
     if name.endswith(" A P I"):
         name = name[: -len(" A P I")] + " API"
     return name or repo
@@ -394,18 +828,45 @@ def _guess_emoji(text: str) -> str:
     return "🔧"
 
 
+# Verbatim from the original inline patterns, doubled backslashes included (see _WHITESPACE_RE).
+_CONVENTIONAL_PREFIX_RE = re.compile(
+    r"^(feat|fix|chore|docs|refactor|perf|test|ci|build|style)(\\([^)]*\\))?:\\s*", re.I
+)
+_FIX_FEAT_PREFIX_RE = re.compile(r"^\\s*(fix|feat)\\s*:\\s*", re.I)
+
+
 def _clean_subject(subject: str) -> str:
     s = subject.strip()
     if not s:
         return s
     # Drop conventional prefixes like "fix:" "feat:" "chore:" etc.
-    s = re.sub(r"^(feat|fix|chore|docs|refactor|perf|test|ci|build|style)(\\([^)]*\\))?:\\s*", "", s, flags=re.I)
+    s = _CONVENTIONAL_PREFIX_RE.sub("", s)
     # Drop PR-style "fix:" also sometimes duplicated.
-    s = re.sub(r"^\\s*(fix|feat)\\s*:\\s*", "", s, flags=re.I)
+    s = _FIX_FEAT_PREFIX_RE.sub("", s)
     # Title case first letter.
     s = s[0].upper() + s[1:] if s else s
     return s
 
+_PAST_TENSE_LEADS = {
+    "fix": "Fixed",
+    "fixed": "Fixed",
+    "add": "Added",
+    "added": "Added",
+    "remove": "Removed",
+    "removed": "Removed",
+    "improve": "Improved",
+    "improved": "Improved",
+    "update": "Updated",
+    "updated": "Updated",
+    "refactor": "Refactored",
+    "refactored": "Refactored",
+    "optimize": "Optimized",
+    "optimized": "Optimized",
+    "bump": "Bumped",
+    "bumped": "Bumped",
+}
+
+
 def _past_tense_lead(text: str) -> str:
     # Turn imperative-style first word into past tense for nicer daily updates.
     if not text:
@@ -413,25 +874,7 @@ def _past_tense_lead(text: str) -> str:
     parts = text.split(" ", 1)
     first = parts[0].strip()
     rest = parts[1] if len(parts) > 1 else ""
-    mapping = {
-        "fix": "Fixed",
-        "fixed": "Fixed",
-        "add": "Added",
-        "added": "Added",
-        "remove": "Removed",
-        "removed": "Removed",
-        "improve": "Improved",
-        "improved": "Improved",
-        "update": "Updated",
-        "updated": "Updated",
-        "refactor": "Refactored",
-        "refactored": "Refactored",
-        "optimize": "Optimized",
-        "optimized": "Optimized",
-        "bump": "Bumped",
-        "bumped": "Bumped",
-    }
-    repl = mapping.get(first.lower())
+    repl = _PAST_TENSE_LEADS.get(first.lower())
     if not repl:
         return text
     return f"{repl} {rest}".strip()
@@ -444,18 +887,65 @@ def _pr_fallback_title(*, repo: str, title: str) -> str:
     return f"{cleaned} in {area} {emoji}"
 
 
-def _github_get_pr(
-    *,
-    org: str,
-    repo: str,
-    number: int,
-    token: str | None,
-) -> dict:
-    url = f"{GITHUB_API}/repos/{org}/{repo}/pulls/{number}"
-    pr, _headers = _github_get(url, token)
-    if not isinstance(pr, dict):
-        raise RuntimeError(f"Unexpected PR payload for {org}/{repo}#{number}")
-    return pr
+# (org, repo) -> private, filled by the batched GraphQL prefetch and the per-repo REST fallback.
+_REPO_PRIVATE: dict[tuple[str, str], bool] = {}
+_GRAPHQL_REPOS_PER_QUERY = 50
+
+
+def _github_graphql(query: str, token: str) -> dict:
+    body = _json_dumps_compact({"query": query})
+    _status, _headers, data = _github_fetch(
+        f"{GITHUB_API}/graphql",
+        token,
+        accept="application/vnd.github+json",
+        method="POST",
+        body=body,
+    )
+    payload = _json_loads(data)
+    result = payload.get("data") if isinstance(payload, dict) else None
+    if not isinstance(result, dict):
+        raise RuntimeError(f"GitHub GraphQL error: {payload.get('errors') if isinstance(payload, dict) else payload}")
+    return result
+
+
+def _github_prefetch_repo_visibility(*, org: str, repos: set[str], token: str | None, verbose: bool) -> None:
+    """
+    Resolves visibility for many repos with aliased GraphQL queries (one request per 50 repos).
+
+    Anything this can't resolve (no token, errors, missing repos) is left to the REST lookup.
+    """
+    if not token:
+        return
+    pending = sorted(r for r in repos if (org, r) not in _REPO_PRIVATE)
+    for i in range(0, len(pending), _GRAPHQL_REPOS_PER_QUERY):
+        chunk = pending[i : i + _GRAPHQL_REPOS_PER_QUERY]
+        fields = " ".join(
+            f"r{j}: repository(owner: {json.dumps(org)}, name: {json.dumps(name)}) {{ isPrivate }}"
+            for j, name in enumerate(chunk)
+        )
+        try:
+            data = _github_graphql(f"query {{ {fields} }}", token)
+        except Exception as e:
+            _log(verbose, f"warn: graphql repo visibility failed: {e}")
+            return
+        for j, name in enumerate(chunk):
+            node = data.get(f"r{j}")
+            if isinstance(node, dict) and isinstance(node.get("isPrivate"), bool):
+                _REPO_PRIVATE[(org, name)] = node["isPrivate"]
+
+
+def _github_repo_is_private(*, org: str, repo: str, token: str | None) -> bool:
+    # Search results don't carry repo visibility; look it up once per repo instead of once per PR.
+    cached = _REPO_PRIVATE.get((org, repo))
+    if cached is not None:
+        return cached
+    url = f"{GITHUB_API}/repos/{org}/{repo}"
+    payload, _headers = _github_get(url, token)
+    if not isinstance(payload, dict):
+        raise RuntimeError(f"Unexpected repo payload for {org}/{repo}")
+    private = bool(payload.get("private"))
+    _REPO_PRIVATE[(org, repo)] = private
+    return private
 
 
 def _github_get_pr_files_digest(
@@ -468,48 +958,52 @@ def _github_get_pr_files_digest(
     max_patch_chars: int = 12000,
 ) -> dict:
     page = 1
-    per_page = 100
-    files: list[dict[str, Any]] = []
+    # Only ask for as many files (and patches) as we will keep.
+    per_page = max(1, min(100, max_files))
+    simplified: list[dict[str, Any]] = []
+    patch_buf: list[str] = []
+    # Length of "\n\n".join(patch_buf); once past max_patch_chars, further patches would be truncated away.
+    patch_len = -2
 
-    while len(files) < max_files:
+    # Files are simplified as each page arrives, so the raw payloads are walked once.
+    while len(simplified) < max_files:
         url = f"{GITHUB_API}/repos/{org}/{repo}/pulls/{number}/files?per_page={per_page}&page={page}"
         payload, _headers = _github_get(url, token)
         if not isinstance(payload, list) or not payload:
             break
         for f in payload:
-            if isinstance(f, dict):
-                files.append(f)
-                if len(files) >= max_files:
-                    break
+            if not isinstance(f, dict):
+                continue
+            filename = str(f.get("filename") or "")
+            status = str(f.get("status") or "")
+            additions = int(f.get("additions") or 0)
+            deletions = int(f.get("deletions") or 0)
+            changes = int(f.get("changes") or 0)
+            simplified.append(
+                {
+                    "filename": filename,
+                    "status": status,
+                    "additions": additions,
+                    "deletions": deletions,
+                    "changes": changes,
+                }
+            )
+
+            patch = f.get("patch")
+            if patch_len <= max_patch_chars and isinstance(patch, str):
+                snippet = patch.strip()
+                if snippet:
+                    if len(snippet) > 900:
+                        snippet = snippet[:900] + "\n…(truncated)…"
+                    entry = f"--- {filename} ({status}, +{additions}/-{deletions})\n{snippet}"
+                    patch_buf.append(entry)
+                    patch_len += len(entry) + 2
+            if len(simplified) >= max_files:
+                break
         if len(payload) < per_page:
             break
         page += 1
 
-    simplified: list[dict[str, Any]] = []
-    patch_buf: list[str] = []
-    for f in files:
-        filename = str(f.get("filename") or "")
-        status = str(f.get("status") or "")
-        additions = int(f.get("additions") or 0)
-        deletions = int(f.get("deletions") or 0)
-        changes = int(f.get("changes") or 0)
-        simplified.append(
-            {
-                "filename": filename,
-                "status": status,
-                "additions": additions,
-                "deletions": deletions,
-                "changes": changes,
-            }
-        )
-
-        patch = f.get("patch")
-        if isinstance(patch, str) and patch.strip():
-            snippet = patch.strip()
-            if len(snippet) > 900:
-                snippet = snippet[:900] + "\n…(truncated)…"
-            patch_buf.append(f"--- {filename} ({status}, +{additions}/-{deletions})\n{snippet}")
-
     patch_text = "\n\n".join(patch_buf)
     if len(patch_text) > max_patch_chars:
         patch_text = patch_text[:max_patch_chars] + "\n…(truncated)…"
@@ -536,25 +1030,102 @@ def _openai_chat_completions(
         "temperature": 0.2,
         "max_tokens": max_tokens,
         "response_format": {"type": "json_object"},
+        "stream": True,
     }
-    data = json.dumps(payload).encode("utf-8")
+    data = _json_dumps_compact(payload)
 
     headers = {
         "Content-Type": "application/json",
         "Authorization": f"Bearer {api_key}",
         "User-Agent": "AceDataCloud-Roadmap-PR-Sync",
     }
-    req = urllib.request.Request(url, data=data, headers=headers, method="POST")
+    parts = urllib.parse.urlsplit(url)
+    resp = _http_open("POST", url, headers=headers, body=data, timeout=60)
+    drained = False
     try:
-        with urllib.request.urlopen(req, timeout=60, context=_URL_CONTEXT) as resp:
-            body = resp.read().decode("utf-8")
-            parsed = json.loads(body)
+        content_type = resp.getheader("Content-Type") or ""
+        if resp.status >= 400 or "text/event-stream" not in content_type:
+            # Errors, and gateways that ignore "stream", come back as a plain JSON body.
+            body = resp.read()
+            drained = True
+            if resp.status >= 400:
+                details = body.decode("utf-8", errors="replace")
+                raise RuntimeError(f"OpenAI API error {resp.status}: {details}")
+            parsed = _json_loads(body)
             if not isinstance(parsed, dict):
                 raise RuntimeError("OpenAI response is not an object")
             return parsed
-    except urllib.error.HTTPError as e:
-        details = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
-        raise RuntimeError(f"OpenAI API error {e.code}: {details}") from e
+        content, drained = _read_openai_stream(resp)
+    finally:
+        if not drained or resp.will_close:
+            _http_drop_connection(parts.scheme, parts.netloc)
+    # Same shape as a non-streamed completion, so callers don't care which one they got.
+    return {"choices": [{"message": {"role": "assistant", "content": content}}]}
+
+
+def _read_openai_stream(resp: http.client.HTTPResponse) -> tuple[str, bool]:
+    """
+    Accumulates `delta.content` from a chat completion SSE stream.
+
+    Stops reading as soon as the content holds a complete JSON object (the model has nothing useful left to
+    say in json_object mode). Returns (content, drained) where drained tells whether the body was consumed.
+    """
+    pieces: list[str] = []
+    while True:
+        line = resp.readline()
+        if not line:
+            return "".join(pieces), True
+        line = line.strip()
+        if not line.startswith(b"data:"):
+            continue
+        event = line[5:].strip()
+        if event == b"[DONE]":
+            resp.read()
+            return "".join(pieces), True
+        try:
+            chunk = _json_loads(event)
+        except ValueError:
+            continue
+        choices = chunk.get("choices") if isinstance(chunk, dict) else None
+        if not isinstance(choices, list) or not choices or not isinstance(choices[0], dict):
+            continue
+        delta = choices[0].get("delta")
+        piece = delta.get("content") if isinstance(delta, dict) else None
+        if not isinstance(piece, str) or not piece:
+            continue
+        pieces.append(piece)
+        if "}" in piece:
+            content = "".join(pieces)
+            if _find_json_span(content):
+                return content, False
+
+
+def _find_json_span(text: str) -> tuple[int, int] | None:
+    """Locates the first balanced {...} object in one linear pass, skipping braces inside strings."""
+    start = text.find("{")
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                return start, i + 1
+    return None
 
 
 def _extract_openai_json(content: str) -> dict | None:
@@ -562,15 +1133,15 @@ def _extract_openai_json(content: str) -> dict | None:
     if not content:
         return None
     try:
-        parsed = json.loads(content)
+        parsed = _json_loads(content)
         return parsed if isinstance(parsed, dict) else None
     except Exception:
         pass
-    m = re.search(r"\{.*\}", content, flags=re.DOTALL)
-    if not m:
+    span = _find_json_span(content)
+    if not span:
         return None
     try:
-        parsed = json.loads(m.group(0))
+        parsed = _json_loads(content[span[0] : span[1]])
         return parsed if isinstance(parsed, dict) else None
     except Exception:
         return None
@@ -624,7 +1195,7 @@ def _summarize_pr_with_openai(
         },
         {
             "role": "user",
-            "content": json.dumps(user_payload, ensure_ascii=False),
+            "content": _json_dumps_compact(user_payload).decode("utf-8"),
         },
     ]
 
@@ -655,10 +1226,14 @@ def _summarize_pr_with_openai(
     summary = str(out_summary).strip() if isinstance(out_summary, str) and out_summary.strip() else None
     tags: list[str] = []
     if isinstance(out_tags, list):
+        seen: set[str] = set()
         for t in out_tags:
-            if isinstance(t, str) and t.strip():
-                tags.append(t.strip())
-    tags = list(dict.fromkeys(tags))  # stable unique
+            if not isinstance(t, str):
+                continue
+            t = t.strip()
+            if t and t not in seen:  # stable unique
+                seen.add(t)
+                tags.append(t)
     return title, summary, tags
 
 
@@ -680,6 +1255,12 @@ def main(argv: list[str]) -> int:
     parser.add_argument("--bootstrap-days", type=int, default=14)
     parser.add_argument("--max-items", type=int, default=200)
     parser.add_argument("--max-new", type=int, default=30, help="Max new PR items to add per run")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=env_int("PR_SYNC_CONCURRENCY", PR_FETCH_WORKERS),
+        help="Concurrent per-PR fetch/summarize workers",
+    )
     parser.add_argument(
         "--author-filter",
         choices=["org", "none"],
@@ -700,7 +1281,11 @@ def main(argv: list[str]) -> int:
     openai_model = str(args.openai_model or "").strip() or "gpt-4o-mini"
     verbose = bool(args.verbose)
     run_at = _utc_now()
-    excluded_repos = {str(r or "").strip().lower() for r in (args.exclude_repo or []) if str(r or "").strip()}
+    org_lower = args.org.lower()
+    author_filter_org = args.author_filter == "org"
+    excluded_repos = frozenset(
+        str(r or "").strip().lower() for r in (args.exclude_repo or []) if str(r or "").strip()
+    )
 
     _log(
         verbose,
@@ -709,6 +1294,7 @@ def main(argv: list[str]) -> int:
             f" org={args.org}"
             f" max_items={args.max_items}"
             f" max_new_prs={args.max_new}"
+            f" concurrency={args.concurrency}"
             f" author_filter={args.author_filter}"
             f" dry_run={args.dry_run}"
         ),
@@ -720,9 +1306,15 @@ def main(argv: list[str]) -> int:
         f"sync: openai_enabled={bool(openai_api_key)} model={openai_model} base_url={openai_base_url}",
     )
 
-    allowed_logins: set[str] = set()
-    if args.author_filter == "org":
-        allowed_logins = _github_get_allowed_logins(org=args.org, token=token, verbose=verbose)
+    allowed_logins: frozenset[str] = frozenset()
+    if author_filter_org:
+        allowed_logins = frozenset(
+            _github_get_allowed_logins(
+                org=args.org,
+                token=token,
+                verbose=verbose,
+            )
+        )
         _log(verbose, f"authors: allowed_total={len(allowed_logins)}")
 
     daily_index_path = Path(args.daily_updates)
@@ -757,11 +1349,9 @@ def main(argv: list[str]) -> int:
                         )
 
                 daily_index = {
-                    "$schema": "./index.schema.json",
+                    **_DEFAULT_INDEX,
                     "title": str(legacy_doc.get("title") or "Daily Updates"),
                     "subtitle": str(legacy_doc.get("subtitle") or ""),
-                    "initial_open_days": 3,
-                    "page_size_days": 20,
                     "days": sorted(by_day.keys(), reverse=True),
                 }
                 if not args.dry_run:
@@ -770,59 +1360,41 @@ def main(argv: list[str]) -> int:
                     except Exception as e:
                         _log(verbose, f"warn: failed to delete legacy {legacy}: {e}")
             else:
-                daily_index = {
-                    "$schema": "./index.schema.json",
-                    "title": "Daily Updates",
-                    "subtitle": "",
-                    "initial_open_days": 3,
-                    "page_size_days": 20,
-                    "days": [],
-                }
+                daily_index = {**_DEFAULT_INDEX, "days": []}
         else:
-            daily_index = {
-                "$schema": "./index.schema.json",
-                "title": "Daily Updates",
-                "subtitle": "",
-                "initial_open_days": 3,
-                "page_size_days": 20,
-                "days": [],
-            }
+            daily_index = {**_DEFAULT_INDEX, "days": []}
 
     daily_index = _coerce_daily_updates_index(daily_index)
 
     days: list[str] = list(daily_index.get("days") or [])
-    daily_by_day: dict[str, list[dict]] = {}
-    existing_keys: set[str] = set()
+    existing_keys: set[str] | frozenset[str] = set()
 
-    # Discover day files even if index is missing entries.
-    for p in daily_dir.glob("*.json"):
-        day = p.stem
-        if _is_day(day) and day not in days:
-            days.append(day)
+    # Discover day files even if index is missing entries. This single listing is reused for the index
+    # rewrite at the end: the only day files created in between are the ones this run writes.
+    day_files = {p.stem for p in daily_dir.iterdir() if p.suffix == ".json" and _is_day(p.stem)}
 
-    days = sorted(set(days), reverse=True)
+    days = sorted(set(days) | day_files, reverse=True)
     daily_index["days"] = days
 
-    for day in days:
-        day_path = daily_dir / f"{day}.json"
-        if not day_path.exists():
-            daily_by_day[day] = []
-            continue
-        try:
-            doc = _read_json(str(day_path))
-            items = _coerce_daily_day(doc, day=day)
-        except Exception as e:
-            _log(verbose, f"warn: failed to load {day_path}: {e}")
-            items = []
-        daily_by_day[day] = items
-        for it in items:
-            key = str(it.get("id") or "").strip()
-            if key:
-                existing_keys.add(key)
     last_pr_sync = _load_state(args.state, args.bootstrap_days)
 
     # Search query only supports date granularity; subtract 1 day for safety.
     pr_since_date = (last_pr_sync - dt.timedelta(days=1)).date().isoformat()
+
+    # Items are filed under their merge day and the search only returns PRs merged on/after
+    # pr_since_date, so older day files can't collide with (or receive) anything this run.
+    for day in days:
+        if day < pr_since_date:
+            break
+        day_path = daily_dir / f"{day}.json"
+        try:
+            existing_keys |= _scan_day_keys(day_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            continue
+        except Exception as e:
+            _log(verbose, f"warn: failed to scan {day_path}: {e}")
+    # Read-only from here on; keys added this run are tracked in added_key_set.
+    existing_keys = frozenset(existing_keys)
     _log(
         verbose,
         (
@@ -836,83 +1408,104 @@ def main(argv: list[str]) -> int:
         token=token,
         max_items=args.max_items,
         exclude_repos=args.exclude_repo or [],
+        updated_after=last_pr_sync,
     )
-    _log(verbose, f"sync: github_pr_search_results={len(raw_prs)}")
-
-    new_items: list[tuple[dt.datetime, str, dict]] = []
-    max_seen_pr_sync = last_pr_sync
-    new_prs_added = 0
-
-    for it in raw_prs:
-        if not isinstance(it, dict):
-            continue
-
-        html_url = str(it.get("html_url") or "").strip()
-        if not html_url:
-            continue
-
-        parsed = _parse_pull_url(html_url)
-        if not parsed:
-            continue
-        owner, repo, number = parsed
-        if owner.lower() != args.org.lower():
-            continue
-
-        item_key = f"gh:pr:{owner}/{repo}#{number}"
-        if item_key in existing_keys:
-            continue
+    search_results_seen = 0
+
+    # Cheap, local filtering first: everything that can be decided from the search payload (merge time,
+    # repo exclusion, author filter) runs before any per-PR network round-trip. Pulled lazily, so search
+    # pages past what --max-new needs are never fetched.
+    def _iter_candidates() -> Iterator[_PrCandidate]:
+        nonlocal search_results_seen
+        for it in raw_prs:
+            search_results_seen += 1
+            if not isinstance(it, dict):
+                continue
 
-        if new_prs_added >= args.max_new:
-            break
+            html_url = str(it.get("html_url") or "").strip()
+            if not html_url:
+                continue
 
-        try:
-            pr = _github_get_pr(org=args.org, repo=repo, number=number, token=token)
-        except Exception as e:
-            _log(verbose, f"skip: pr {repo}#{number} reason=pr_fetch_failed err={e} url={html_url}")
-            continue
-        merged_at_raw = pr.get("merged_at")
-        if not merged_at_raw:
-            continue
-        merged_at = _parse_iso_datetime(str(merged_at_raw))
-        if merged_at <= last_pr_sync:
-            continue
+            parsed = _parse_pull_url(html_url)
+            if not parsed:
+                continue
+            owner, repo, number = parsed
+            # The search is scoped to the org, so the owner nearly always matches verbatim; lower only if not.
+            if owner != args.org and owner.lower() != org_lower:
+                continue
 
-        author_login = None
-        user = pr.get("user")
-        if isinstance(user, dict):
-            author_login = str(user.get("login") or "").strip()
+            item_key = sys.intern(f"gh:pr:{owner}/{repo}#{number}")
+            if item_key in existing_keys:
+                continue
 
-        # Check repo exclusion, but allow Copilot PRs even from excluded repos
-        is_copilot = author_login and author_login.lower() == COPILOT_BOT_LOGIN
-        if repo.lower() in excluded_repos and not is_copilot:
-            _log(verbose, f"skip: pr {repo}#{number} reason=repo_excluded url={html_url}")
-            continue
-        if args.author_filter == "org":
-            if not author_login:
-                _log(verbose, f"skip: pr {repo}#{number} reason=no_author_login url={html_url}")
+            pull_request = it.get("pull_request")
+            merged_at_raw = pull_request.get("merged_at") if isinstance(pull_request, dict) else None
+            merged_at_raw = merged_at_raw or it.get("closed_at")
+            if not merged_at_raw:
                 continue
-            if author_login.lower() not in allowed_logins:
-                _log(
-                    verbose,
-                    f"skip: pr {repo}#{number} reason=author_not_allowed author={author_login} url={html_url}",
-                )
+            merged_at = _parse_iso_datetime(str(merged_at_raw))
+            if merged_at <= last_pr_sync:
                 continue
 
-        title = str(pr.get("title") or "").strip()
+            author_login = None
+            user = it.get("user")
+            if isinstance(user, dict):
+                author_login = str(user.get("login") or "").strip()
+            repo_excluded = bool(excluded_repos) and repo.lower() in excluded_repos
+            # Only the repo exclusion (Copilot bypass) and the org author filter look at the login.
+            author_lower = author_login.lower() if author_login and (repo_excluded or author_filter_org) else ""
+
+            # Check repo exclusion, but allow Copilot PRs even from excluded repos
+            if repo_excluded and author_lower != COPILOT_BOT_LOGIN:
+                _log(verbose, f"skip: pr {repo}#{number} reason=repo_excluded url={html_url}")
+                continue
+            if author_filter_org:
+                if not author_login:
+                    _log(verbose, f"skip: pr {repo}#{number} reason=no_author_login url={html_url}")
+                    continue
+                if author_lower not in allowed_logins:
+                    _log(
+                        verbose,
+                        f"skip: pr {repo}#{number} reason=author_not_allowed author={author_login} url={html_url}",
+                    )
+                    continue
+
+            yield _PrCandidate(
+                pr=it,
+                html_url=html_url,
+                repo=repo,
+                number=number,
+                key=item_key,
+                merged_at=merged_at,
+                author_login=author_login,
+            )
+
+    def _process_candidate(candidate: _PrCandidate) -> tuple[dt.datetime, str, dict] | None:
+        # The search (issues) payload already carries everything we need from the PR itself.
+        html_url, repo, number = candidate.html_url, candidate.repo, candidate.number
+        merged_at, author_login = candidate.merged_at, candidate.author_login
+        title = str(candidate.pr.get("title") or "").strip()
         if not title:
-            continue
+            return None
 
-        body = str(pr.get("body") or "").strip()
         try:
-            digest = _github_get_pr_files_digest(org=args.org, repo=repo, number=number, token=token)
+            is_private = _github_repo_is_private(org=args.org, repo=repo, token=token)
         except Exception as e:
-            _log(verbose, f"warn: pr digest failed for {repo}#{number}: {e}")
-            digest = {"files": [], "patch_excerpt": "", "files_count": 0}
+            _log(verbose, f"skip: pr {repo}#{number} reason=repo_fetch_failed err={e} url={html_url}")
+            return None
 
+        body = str(candidate.pr.get("body") or "").strip()
         pretty_title: str | None = None
         summary: str | None = None
         extra_tags: list[str] = []
         if openai_api_key:
+            # The files digest only feeds the summarizer; don't pay for it otherwise.
+            try:
+                digest = _github_get_pr_files_digest(org=args.org, repo=repo, number=number, token=token)
+            except Exception as e:
+                _log(verbose, f"warn: pr digest failed for {repo}#{number}: {e}")
+                digest = {"files": [], "patch_excerpt": "", "files_count": 0}
+
             try:
                 _log(verbose, f"openai: summarizing {repo}#{number} files={digest.get('files_count')}")
                 pretty_title, summary, extra_tags = _summarize_pr_with_openai(
@@ -936,18 +1529,13 @@ def main(argv: list[str]) -> int:
                 print(f"OpenAI summarization failed for {repo}#{number}: {e}", file=sys.stderr)
 
         day = merged_at.date().isoformat()
-        is_private = False
-        base = pr.get("base")
-        if isinstance(base, dict):
-            base_repo = base.get("repo")
-            if isinstance(base_repo, dict):
-                is_private = bool(base_repo.get("private"))
 
         fallback_title = _pr_fallback_title(repo=repo, title=title)
         item: dict[str, Any] = {
-            "id": item_key,
+            "id": candidate.key,
             "title": pretty_title or fallback_title,
-            "tags": ["github", "pr", repo],
+            # Literals are interned already; the repo name repeats across many items.
+            "tags": ["github", "pr", sys.intern(repo)],
             "public": not is_private,
         }
         if not is_private:
@@ -955,16 +1543,61 @@ def main(argv: list[str]) -> int:
         if summary:
             item["summary"] = summary
         if extra_tags:
-            item["tags"] = list(dict.fromkeys([*item["tags"], *extra_tags]))
+            tags = item["tags"]
+            seen = set(tags)
+            for t in extra_tags:
+                if t not in seen:
+                    seen.add(t)
+                    tags.append(t)
 
-        new_items.append((merged_at, day, item))
-        new_prs_added += 1
-        if merged_at > max_seen_pr_sync:
-            max_seen_pr_sync = merged_at
         _log(
             verbose,
             f"add: pr {repo}#{number} author={author_login or 'unknown'} merged_at={merged_at.isoformat()} url={html_url}",
         )
+        return merged_at, day, item
+
+    new_items: list[tuple[dt.datetime, str, dict]] = []
+    max_seen_pr_sync = last_pr_sync
+    new_prs_added = 0
+
+    def _take_result(result: tuple[dt.datetime, str, dict] | None) -> None:
+        nonlocal max_seen_pr_sync, new_prs_added
+        if result is None:
+            return
+        new_items.append(result)
+        new_prs_added += 1
+        if result[0] > max_seen_pr_sync:
+            max_seen_pr_sync = result[0]
+
+    # Fan the per-PR round-trips out over a thread pool. Candidates are taken in windows no
+    # larger than the remaining --max-new budget, so we never fetch/summarize more PRs than
+    # the serial loop would have, and results are consumed in search order.
+    # The core quota is looked up before the first fan-out and re-checked before each submit: once it runs
+    # low, only one PR is in flight, so the rate-limit pauses in `_github_fetch` pace the run instead of N
+    # workers tripping them at once.
+    if "core" not in _rate_limit_remaining:
+        _github_prime_rate_limit(token, verbose=verbose)
+    concurrency = max(1, int(args.concurrency))
+    candidates = _iter_candidates()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while new_prs_added < args.max_new:
+            window = list(itertools.islice(candidates, args.max_new - new_prs_added))
+            if not window:
+                break
+            _github_prefetch_repo_visibility(
+                org=args.org,
+                repos={c.repo for c in window},
+                token=token,
+                verbose=verbose,
+            )
+            in_flight: deque[Future] = deque()
+            for candidate in window:
+                while len(in_flight) >= (1 if _core_quota_low() else concurrency):
+                    _take_result(in_flight.popleft().result())
+                in_flight.append(executor.submit(_process_candidate, candidate))
+            while in_flight:
+                _take_result(in_flight.popleft().result())
+    _log(verbose, f"sync: github_pr_search_results={search_results_seen}")
 
     def _index_doc(index: dict[str, Any], *, days: list[str]) -> dict[str, Any]:
         return {
@@ -985,38 +1618,46 @@ def main(argv: list[str]) -> int:
 
     touched_days: set[str] = set()
     added_keys: list[str] = []
+    added_key_set: set[str] = set()
 
     if new_items:
-        new_items.sort(key=lambda x: x[0], reverse=True)
-
+        # Grouping first and sorting each (small) day is enough: walking the days newest-first yields the
+        # same order a global newest-first sort would.
         new_by_day: dict[str, list[tuple[dt.datetime, dict[str, Any]]]] = {}
         for timestamp, day, item in new_items:
             new_by_day.setdefault(day, []).append((timestamp, item))
 
-        for day, items_with_ts in new_by_day.items():
+        for day in sorted(new_by_day, reverse=True):
+            items_with_ts = new_by_day[day]
             items_with_ts.sort(key=lambda x: x[0], reverse=True)
             inserts: list[dict[str, Any]] = []
             for _ts, item in items_with_ts:
-                key = str(item.get("id") or "").strip()
-                if not key or key in existing_keys:
+                key = item["id"]
+                if key in existing_keys or key in added_key_set:
                     continue
                 inserts.append(item)
-                existing_keys.add(key)
+                added_key_set.add(key)
                 added_keys.append(key)
 
             if not inserts:
                 continue
 
-            existing = daily_by_day.get(day, [])
-            inserted_ids = {str(it.get("id") or "").strip() for it in inserts}
-            existing_filtered = [it for it in existing if str(it.get("id") or "").strip() not in inserted_ids]
-            daily_by_day[day] = inserts + existing_filtered
+            # Full parse only for the days that actually receive new items; each is loaded once, here.
+            day_path = daily_dir / f"{day}.json"
+            existing: list[dict] = []
+            if day_path.exists():
+                try:
+                    existing = _coerce_daily_day(_read_json(str(day_path)), day=day)
+                except Exception as e:
+                    _log(verbose, f"warn: failed to load {day_path}: {e}")
+            # Both sides carry a normalized "id": `_coerce_daily_day` fills it in and new items are built with one.
+            inserted_ids = {it["id"] for it in inserts}
+            existing_filtered = [it for it in existing if it["id"] not in inserted_ids]
             touched_days.add(day)
-
-    # Ensure the index lists only day files that exist (plus any newly touched days).
-    existing_day_files = {p.stem for p in daily_dir.glob("*.json") if _is_day(p.stem)}
-    index_days = sorted(existing_day_files | touched_days, reverse=True)
-    daily_index_out = _index_doc(daily_index, days=index_days)
+            # Persist each day as soon as it is merged (before the index, so the index always references
+            # existing files). `_write_json` leaves files whose bytes didn't change alone.
+            if not args.dry_run:
+                _write_json(str(day_path), _day_doc(day, inserts + existing_filtered))
 
     if args.dry_run:
         if new_items:
@@ -1029,14 +1670,8 @@ def main(argv: list[str]) -> int:
             print("No new items found (PRs).")
         return 0
 
-    # Persist day files first (so index always references existing files).
-    for day in sorted(touched_days, reverse=True):
-        items = daily_by_day.get(day, [])
-        _write_json(str(daily_dir / f"{day}.json"), _day_doc(day, items))
-
-    # Refresh day files after writes and persist the index.
-    day_files_after = {p.stem for p in daily_dir.glob("*.json") if _is_day(p.stem)}
-    _write_json(str(daily_index_path), _index_doc(daily_index, days=sorted(day_files_after, reverse=True)))
+    # Persist the index over the day files that exist now: the ones listed at startup plus the touched days.
+    _write_json(str(daily_index_path), _index_doc(daily_index, days=sorted(day_files | touched_days, reverse=True)))
 
     # Persist sync state only when there are new items to avoid unnecessary commits.
     if not new_items: